@@ -5,15 +5,27 @@ AppShak Launcher - Simple CLI for running different AppShak environments.
 For observers, builders, and QC agents.
 """
 
+import argparse
 import asyncio
-import subprocess
 import sys
 import os
+import threading
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Ensure we're in the correct directory
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
 processes = {}
+watchers = set()
+
+# Production favors idle efficiency: slow heartbeat, block on the bus until an event arrives.
+PRODUCTION_TIMING = {"heartbeat_interval": 60.0, "event_poll_timeout": None}
+DEBUG_TIMING = {"heartbeat_interval": 15.0, "event_poll_timeout": 1.0}
+kernel_timing = dict(PRODUCTION_TIMING)
 
 async def launch_original():
     """Launch the Original AppShak kernel (core library)."""
@@ -23,78 +35,159 @@ async def launch_original():
     try:
         from appshak import AppShakKernel
 
-        config = {
-            "heartbeat_interval": 15,
-            "event_poll_timeout": 1.0,
-        }
+        config = dict(kernel_timing)
 
         kernel = AppShakKernel(config)
-        await kernel.start()
+        runner = asyncio.create_task(kernel.start())
 
         print("Original AppShak running. Press Ctrl+C to stop and return to menu.")
 
         try:
-            while kernel.running:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
+            await kernel.shutdown_event.wait()
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("Stopping Original AppShak...")
+        finally:
             await kernel.shutdown()
+            await asyncio.gather(runner, return_exceptions=True)
             print("Original AppShak stopped.")
 
     except ImportError as e:
         print(f"Error importing AppShak: {e}")
         print("Make sure you're running from the AppShak_HQ directory.")
 
-def launch_live():
+def server_command(app, port, production=None):
+    """Build the server argv: gunicorn + UvicornWorker in prod, uvicorn --reload in dev."""
+    if production is None:
+        production = os.environ.get("APPSHAK_ENV", "").strip().lower() in ("prod", "production")
+    if production:
+        return [
+            sys.executable, '-m', 'gunicorn',
+            '-k', 'uvicorn.workers.UvicornWorker',
+            '-w', str(os.cpu_count() or 1),
+            '--bind', f'0.0.0.0:{port}',
+            app,
+        ]
+    return [
+        sys.executable, '-m', 'uvicorn',
+        app,
+        '--host', '0.0.0.0',
+        '--port', str(port),
+        '--loop', 'uvloop' if uvloop is not None else 'auto',
+        '--reload',
+        '--reload-dir', app.split('.', 1)[0],
+        '--reload-delay', '0.5',
+    ]
+
+async def launch_live(production=None):
     """Launch the Live AppShak server."""
-    if 'live' in processes and processes['live'].poll() is None:
+    if 'live' in processes and processes['live'].returncode is None:
         print("Live server already running on port 8000")
         return
 
     print("Starting Live server on port 8000...")
     try:
-        p = subprocess.Popen([
-            sys.executable, '-m', 'uvicorn',
-            'appshak_live.server:app',
-            '--host', '0.0.0.0',
-            '--port', '8000',
-            '--reload'
-        ])
+        p = await asyncio.create_subprocess_exec(
+            *server_command('appshak_live.server:app', 8000, production)
+        )
         processes['live'] = p
+        watch_server('live', p)
         print("Live server started. Access at http://localhost:8000")
     except Exception as e:
         print(f"Error starting Live server: {e}")
 
-def launch_office():
+async def launch_office(production=None):
     """Launch the Office AppShak server."""
-    if 'office' in processes and processes['office'].poll() is None:
+    if 'office' in processes and processes['office'].returncode is None:
         print("Office server already running on port 8001")
         return
 
     print("Starting Office server on port 8001...")
     try:
-        p = subprocess.Popen([
-            sys.executable, '-m', 'uvicorn',
-            'appshak_office.server:app',
-            '--host', '0.0.0.0',
-            '--port', '8001',
-            '--reload'
-        ])
+        p = await asyncio.create_subprocess_exec(
+            *server_command('appshak_office.server:app', 8001, production)
+        )
         processes['office'] = p
+        watch_server('office', p)
         print("Office server started. Access at http://localhost:8001")
     except Exception as e:
         print(f"Error starting Office server: {e}")
 
-def stop_server(name):
+def watch_server(name, p):
+    """Supervise a server in the background and report if it exits on its own."""
+    async def _watch():
+        returncode = await p.wait()
+        if processes.get(name) is p:
+            print(f"\n{name.capitalize()} server exited unexpectedly (code {returncode}).")
+
+    task = asyncio.create_task(_watch())
+    watchers.add(task)
+    task.add_done_callback(watchers.discard)
+
+async def stop_server(name):
     """Stop a running server."""
-    if name in processes and processes[name].poll() is None:
+    if name in processes and processes[name].returncode is None:
         print(f"Stopping {name.capitalize()} server...")
-        processes[name].terminate()
-        processes[name].wait()
+        # Drop it from the registry first so the watcher treats the exit as expected.
+        p = processes.pop(name)
+        p.terminate()
+        await p.wait()
         print(f"{name.capitalize()} server stopped.")
     else:
         print(f"{name.capitalize()} server not running.")
 
+async def stop_all_servers():
+    """Terminate every running server and wait for it to exit."""
+    for name, p in list(processes.items()):
+        processes.pop(name)
+        if p.returncode is None:
+            p.terminate()
+            await p.wait()
+
+_stdin_pending = b""
+
+def _read_stdin_line():
+    """Read one line straight from fd 0, bypassing sys.stdin's buffer lock."""
+    global _stdin_pending
+    while b"\n" not in _stdin_pending:
+        chunk = os.read(sys.stdin.fileno(), 4096)
+        if not chunk:
+            if _stdin_pending:
+                break
+            raise EOFError
+        _stdin_pending += chunk
+    line, _, _stdin_pending = _stdin_pending.partition(b"\n")
+    return line.decode(errors="replace").rstrip("\r")
+
+def read_command(prompt):
+    """Read one line on a daemon thread so a pending prompt never blocks loop shutdown.
+
+    The thread uses os.read rather than input(): a daemon thread parked inside input()
+    holds the stdin buffer lock and aborts interpreter finalization.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(line, error):
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(line)
+
+    def reader():
+        try:
+            line, error = _read_stdin_line(), None
+        except (EOFError, OSError) as exc:
+            line, error = None, exc if isinstance(exc, EOFError) else EOFError(str(exc))
+        try:
+            loop.call_soon_threadsafe(settle, line, error)
+        except RuntimeError:
+            pass  # The loop already closed; nobody is waiting for this line.
+
+    print(prompt, end="", flush=True)
+    threading.Thread(target=reader, name="launcher-stdin", daemon=True).start()
+    return future
+
 def print_menu():
     """Print the main menu."""
     print("\n" + "="*50)
@@ -145,6 +238,7 @@ def handle_help():
     print("- Original kernel runs in foreground and blocks the menu")
     print("- Use Ctrl+C to stop the Original kernel and return to menu")
     print("- Make sure dependencies are installed for Live/Office")
+    print("- Set APPSHAK_ENV=prod to serve via gunicorn + UvicornWorker (one worker per core, no reload)")
     print("="*60)
 
 async def main():
@@ -155,36 +249,60 @@ async def main():
     while True:
         print_menu()
         try:
-            cmd = input("> ").strip().lower()
-        except KeyboardInterrupt:
-            print("\nExiting...")
+            # Read input off the event loop so server watchers keep running meanwhile.
+            cmd = (await read_command("> ")).strip().lower()
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
+            # Ctrl+C under asyncio.run arrives as cancellation of main(); clean up like 'q'.
+            print("\nStopping all servers...")
+            await stop_all_servers()
+            print("Exiting...")
             break
 
         if cmd == '1':
             await launch_original()
         elif cmd == '2':
-            launch_live()
+            await launch_live()
         elif cmd == '3':
-            launch_office()
+            await launch_office()
         elif cmd == 's':
-            launch_live()
+            await launch_live()
         elif cmd == 'o':
-            launch_office()
+            await launch_office()
         elif cmd == 'x':
-            stop_server('live')
+            await stop_server('live')
         elif cmd == 'y':
-            stop_server('office')
+            await stop_server('office')
         elif cmd == '/help':
             handle_help()
         elif cmd == 'q':
             print("Stopping all servers...")
-            for name, p in processes.items():
-                if p.poll() is None:
-                    p.terminate()
+            await stop_all_servers()
             print("Exiting AppShak Launcher. Goodbye!")
             break
         else:
             print("Invalid command. Type /help for help.")
 
+def _optional_float(value):
+    """Parse a float, treating 'none' as None (block until an event arrives)."""
+    if value.strip().lower() == "none":
+        return None
+    return float(value)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AppShak Launcher")
+    parser.add_argument("--debug", action="store_true", help="Use debug timing (15s heartbeat with idle scans).")
+    parser.add_argument("--heartbeat-interval", type=float, default=None)
+    parser.add_argument("--event-poll-timeout", type=_optional_float, default=argparse.SUPPRESS,
+                        help="Any number enables idle scans; 'none' waits for events only.")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_args()
+    kernel_timing.update(DEBUG_TIMING if args.debug else PRODUCTION_TIMING)
+    if args.heartbeat_interval is not None:
+        kernel_timing["heartbeat_interval"] = args.heartbeat_interval
+    if hasattr(args, "event_poll_timeout"):
+        kernel_timing["event_poll_timeout"] = args.event_poll_timeout
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main())
@@ -5,12 +5,28 @@ import asyncio
 
 from appshak import AppShakKernel
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional accelerator
+    uvloop = None
+
+
+def _optional_float(value: str) -> float | None:
+    if value.strip().lower() == "none":
+        return None
+    return float(value)
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run AppShak kernel.")
     parser.add_argument("--hours", type=float, default=24.0, help="How long to run before shutdown.")
     parser.add_argument("--heartbeat-interval", type=float, default=15.0)
-    parser.add_argument("--event-poll-timeout", type=float, default=1.0)
+    parser.add_argument(
+        "--event-poll-timeout",
+        type=_optional_float,
+        default=1.0,
+        help="Any number enables idle scans every heartbeat interval; 'none' waits for events only.",
+    )
     parser.add_argument("--memory-root", type=str, default="appshak_state")
     parser.add_argument("--whitelist", nargs="*", default=["api.example.com"])
     parser.add_argument("--allow-real-world-impact", action="store_true")
@@ -44,6 +60,8 @@ async def _run(args: argparse.Namespace) -> None:
 def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(_run(args))
 
 
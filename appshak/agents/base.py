@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-import inspect
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Union
 
 from appshak.event_bus import Event, EventType
 
+_UTC = timezone.utc
+_now = datetime.now
+
+# Interned once so origin_id defaults share identity with other agent ids in payload dicts.
+_UNKNOWN_AGENT = sys.intern("unknown_agent")
+_UNKNOWN_ACTION = sys.intern("unknown_action")
+_CONTINUITY_IMPACT = sys.intern("maintaining operational continuity")
+
 
 class BaseAgent(ABC):
     """Critical abstraction for all AppShak agents."""
@@ -19,6 +27,9 @@ class BaseAgent(ABC):
         self.event_bus = kernel.event_bus
         self.global_memory = kernel.global_memory
         self.prime_directive = kernel.PRIME_DIRECTIVE
+        self.shutdown_event = kernel.shutdown_event
+        append_agent_event = getattr(self.global_memory, "append_agent_event", None)
+        self._append_agent_event = append_agent_event if callable(append_agent_event) else None
 
     @abstractmethod
     async def run(self) -> None:
@@ -31,12 +42,11 @@ class BaseAgent(ABC):
         """Exclusive bus communication path for agents."""
         published = await self.event_bus.publish(event)
 
-        append_agent_event = getattr(self.global_memory, "append_agent_event", None)
-        if callable(append_agent_event):
+        if self._append_agent_event is not None:
             agent_name = self.agent_id or "agent"
-            result = append_agent_event(agent_name, published.to_dict())
-            if inspect.isawaitable(result):
-                await result
+            event_dict = published._as_dict_view() if isinstance(published, Event) else published.to_dict()
+            # GlobalMemory.append_agent_event is always a coroutine function.
+            await self._append_agent_event(agent_name, event_dict)
 
         return published
 
@@ -53,11 +63,16 @@ class BaseAgent(ABC):
             explicit_justification=justification,
         )
 
-        normalized_type = event_type if isinstance(event_type, EventType) else EventType(str(event_type))
+        if isinstance(event_type, EventType):
+            normalized_type = event_type
+        else:
+            normalized_type = EventType._value2member_map_.get(str(event_type))
+            if normalized_type is None:
+                raise ValueError(f"{event_type!r} is not a valid EventType")
         return Event(
             type=normalized_type,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            origin_id=self.agent_id or "unknown_agent",
+            timestamp=_now(_UTC).isoformat(),
+            origin_id=self.agent_id or _UNKNOWN_AGENT,
             payload=event_payload,
         )
 
@@ -84,4 +99,4 @@ class BaseAgent(ABC):
         )
         if isinstance(candidate, str) and candidate.strip():
             return candidate
-        return self.justify_action("unknown_action", "maintaining operational continuity")
\ No newline at end of file
+        return self.justify_action(_UNKNOWN_ACTION, _CONTINUITY_IMPACT)
\ No newline at end of file
@@ -1,21 +1,33 @@
 from __future__ import annotations
 
-import asyncio
-from typing import Any, Dict
+import sys
+from typing import Any, Dict, Tuple
 
 from appshak.agents.base import BaseAgent
 from appshak.event_bus import EventType
 
+# Shared, immutable plan template; callers must not mutate "steps".
+_PLAN_STEPS: Tuple[str, ...] = (
+    "validate_inputs",
+    "prepare_external_request_payload",
+    "submit_external_action_request",
+)
+_PROPOSAL_TYPE = EventType.PROPOSAL.value
+
 
 class BuilderAgent(BaseAgent):
     """Level 2: convert approved proposals into executable request plans."""
 
-    agent_id = "forge"
+    agent_id = sys.intern("forge")
     authority_level = 2
 
+    _JUST_PREPARE = (
+        "prepare_external_action_request advances the Prime Directive by "
+        "converting approved solutions into controlled requests for chief review."
+    )
+
     async def run(self) -> None:
-        while self.kernel.running:
-            await asyncio.sleep(0.25)
+        await self.shutdown_event.wait()
 
     async def translate_proposal_to_plan(self, proposal_event: Any) -> Dict[str, Any]:
         proposal = proposal_event.to_dict() if hasattr(proposal_event, "to_dict") else proposal_event
@@ -23,13 +35,9 @@ class BuilderAgent(BaseAgent):
         target_action = payload.get("action", "unspecified_action")
         return {
             "plan_id": f"plan:{target_action}",
-            "source_event_type": EventType.PROPOSAL.value,
+            "source_event_type": _PROPOSAL_TYPE,
             "target_action": target_action,
-            "steps": [
-                "validate_inputs",
-                "prepare_external_request_payload",
-                "submit_external_action_request",
-            ],
+            "steps": _PLAN_STEPS,
         }
 
     async def prepare_external_action_request(self, plan: Dict[str, Any]) -> None:
@@ -39,9 +47,6 @@ class BuilderAgent(BaseAgent):
                 "action": plan.get("target_action", "unspecified_action"),
                 "plan": plan,
             },
-            justification=self.justify_action(
-                "prepare_external_action_request",
-                "converting approved solutions into controlled requests for chief review.",
-            ),
+            justification=self._JUST_PREPARE,
         )
         await self.publish(event)
@@ -1,24 +1,40 @@
 from __future__ import annotations
 
-import asyncio
+import sys
 from datetime import datetime, timezone
 from typing import Any, Dict
 
 from appshak.agents.base import BaseAgent
-from appshak.event_bus import EventType
+from appshak.event_bus import Event, EventType
+
+_UTC = timezone.utc
+_now = datetime.now
 
 
 class ChiefAgent(BaseAgent):
     """Level 3: sole authority for external actions and final decisions."""
 
-    agent_id = "command"
+    agent_id = sys.intern("command")
     authority_level = 3
 
+    # Fixed Prime Directive justifications, formatted once instead of per event.
+    _JUST_ARBITRATE = (
+        "arbitrate_proposal advances the Prime Directive by "
+        "maintaining centralized control while advancing safe, continuous execution."
+    )
+    _JUST_DECIDE = (
+        "chief_external_decision advances the Prime Directive by "
+        "enforcing final authority over external actions with explicit constitutional rationale."
+    )
+    _JUST_APPROVE = (
+        "approve_external_action advances the Prime Directive by "
+        "preserving centralized authority and safe external governance."
+    )
+
     async def run(self) -> None:
-        while self.kernel.running:
-            await asyncio.sleep(0.25)
+        await self.shutdown_event.wait()
 
-    async def arbitrate(self, event: Any) -> Dict[str, Any]:
+    async def arbitrate(self, event: Any) -> Event:
         payload = self._extract_payload(event)
         proposal_action = payload.get("action")
         approved = bool(proposal_action)
@@ -27,20 +43,18 @@ class ChiefAgent(BaseAgent):
             if approved
             else "Denied proposal: missing actionable proposal content."
         )
-        return {
-            "type": EventType.PROPOSAL_DECISION,
-            "origin_id": self.agent_id,
-            "payload": {
+        return Event(
+            type=EventType.PROPOSAL_DECISION,
+            timestamp=_now(_UTC).isoformat(),
+            origin_id=self.agent_id,
+            payload={
                 "action": "arbitrate_proposal",
                 "proposal": event.to_dict() if hasattr(event, "to_dict") else event,
                 "approved": approved,
                 "decision_reason": decision_reason,
-                "prime_directive_justification": self.justify_action(
-                    "arbitrate_proposal",
-                    "maintaining centralized control while advancing safe, continuous execution.",
-                ),
+                "prime_directive_justification": self._JUST_ARBITRATE,
             },
-        }
+        )
 
     async def handle_external_action(self, event: Any) -> None:
         payload = event if isinstance(event, dict) else self._extract_payload(event)
@@ -51,10 +65,7 @@ class ChiefAgent(BaseAgent):
                 "result": payload,
                 "decided_by": self.agent_id,
             },
-            justification=self.justify_action(
-                "chief_external_decision",
-                "enforcing final authority over external actions with explicit constitutional rationale.",
-            ),
+            justification=self._JUST_DECIDE,
         )
         await self.publish(decision_event)
 
@@ -77,11 +88,8 @@ class ChiefAgent(BaseAgent):
             "approved": approved,
             "reason": reason,
             "reviewed_by": self.agent_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "prime_directive_justification": self.justify_action(
-                "approve_external_action",
-                "preserving centralized authority and safe external governance.",
-            ),
+            "timestamp": _now(_UTC).isoformat(),
+            "prime_directive_justification": self._JUST_APPROVE,
         }
 
     @staticmethod
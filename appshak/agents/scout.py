@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import asyncio
+import sys
 
 from appshak.agents.base import BaseAgent
 from appshak.event_bus import EventType
@@ -9,12 +9,16 @@ from appshak.event_bus import EventType
 class ScoutAgent(BaseAgent):
     """Level 1: discovery-only role. Execution is explicitly forbidden."""
 
-    agent_id = "recon"
+    agent_id = sys.intern("recon")
     authority_level = 1
 
+    _JUST_SEARCH = (
+        "search_for_problems advances the Prime Directive by "
+        "continuously discovering valuable real-world opportunities to solve."
+    )
+
     async def run(self) -> None:
-        while self.kernel.running:
-            await asyncio.sleep(0.25)
+        await self.shutdown_event.wait()
 
     async def search_for_problems(self) -> None:
         event = self.build_event(
@@ -24,10 +28,7 @@ class ScoutAgent(BaseAgent):
                 "status": "idle_scan_complete",
                 "agent": self.agent_id,
             },
-            justification=self.justify_action(
-                "search_for_problems",
-                "continuously discovering valuable real-world opportunities to solve.",
-            ),
+            justification=self._JUST_SEARCH,
         )
         await self.publish(event)
 
@@ -6,7 +6,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from itertools import count
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+_UTC = timezone.utc
+_now = datetime.now
 
 
 class EventType(str, Enum):
@@ -25,9 +28,12 @@ class EventType(str, Enum):
     INTENT_DISPATCH = "INTENT_DISPATCH"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class Event:
-    """Event contract for inter-agent communication over the EventBus."""
+    """Event contract for inter-agent communication over the EventBus.
+
+    Instances are frozen and handed to every consumer by reference, never cloned.
+    """
 
     type: EventType
     timestamp: str
@@ -39,34 +45,60 @@ class Event:
         return self.origin_id
 
     def to_dict(self) -> Dict[str, Any]:
+        # _value_ is a plain member attribute; .value goes through the Enum descriptor.
         return {
-            "type": self.type.value,
+            "type": self.type._value_,
             "timestamp": self.timestamp,
             "origin_id": self.origin_id,
             "payload": dict(self.payload),
         }
 
+    def _as_dict_view(self) -> Dict[str, Any]:
+        """Like to_dict, but shares the payload dict; for internal read-only callers."""
+        return {
+            "type": self.type._value_,
+            "timestamp": self.timestamp,
+            "origin_id": self.origin_id,
+            "payload": self.payload,
+        }
+
 
 class EventBus:
     """Async FIFO event transport with deterministic ordering."""
 
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue[Event] = asyncio.Queue()
-        self._publish_lock = asyncio.Lock()
-        self._publish_hooks: List[Callable[[Event], Any]] = []
+    __slots__ = ("_queue", "_put_lock", "_hooks", "_counter")
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max(0, int(maxsize)))
+        # Only a bounded queue can block in put(); see publish().
+        self._put_lock = asyncio.Lock()
+        # (hook, is_async) in registration order, which is also the call order.
+        self._hooks: Tuple[Tuple[Callable[[Event], Any], bool], ...] = ()
         self._counter = count(start=1)
 
     async def publish(self, event: Union[Event, Dict[str, Any]]) -> Event:
         """Publish an event to the queue."""
-        async with self._publish_lock:
-            normalized = self._normalize(event, queue_index=next(self._counter))
-            await self._queue.put(normalized)
+        if self._queue.maxsize:
+            # put() may wait for room, so index assignment and enqueue are serialized:
+            # publishers blocked on a full queue keep queue_index order equal to queue order.
+            async with self._put_lock:
+                normalized = self._stamp(event)
+                await self._queue.put(normalized)
+        else:
+            # Unbounded: stamping + enqueue has no await point, so ordering holds without a lock.
+            normalized = self._stamp(event)
+            self._queue.put_nowait(normalized)
 
-        for hook in list(self._publish_hooks):
+        for hook, is_async in self._hooks:
             try:
-                hook_result = hook(normalized)
-                if inspect.isawaitable(hook_result):
-                    await hook_result
+                if is_async:
+                    await hook(normalized)
+                    continue
+                result = hook(normalized)
+                if result is not None and inspect.isawaitable(result):
+                    # A plain callable that hands back a coroutine (e.g. a lambda wrapping
+                    # an async function) could not be told apart at registration.
+                    await result
             except Exception:
                 continue
         return normalized
@@ -77,39 +109,85 @@ class EventBus:
             return await self._queue.get()
 
         if timeout <= 0:
-            try:
-                return self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                return None
+            return self.get_nowait()
 
         try:
             return await asyncio.wait_for(self._queue.get(), timeout=timeout)
         except asyncio.TimeoutError:
             return None
 
+    def get_nowait(self) -> Optional[Event]:
+        """Return the next queued event without waiting, or None when empty."""
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    async def get_batch(self, max_n: int, timeout: Optional[float] = None) -> List[Event]:
+        """Wait for one event (up to timeout), then drain up to max_n already-queued events."""
+        first = await self.get_next(timeout=timeout)
+        if first is None:
+            return []
+        batch = [first]
+        while len(batch) < max_n:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
     def add_publish_hook(self, hook: Callable[[Event], Any]) -> None:
-        self._publish_hooks.append(hook)
+        """Register a hook, classified once as sync or async at registration time."""
+        if inspect.iscoroutinefunction(hook) or inspect.iscoroutinefunction(type(hook).__call__):
+            self.add_async_publish_hook(hook)
+        else:
+            self.add_sync_publish_hook(hook)
+
+    def add_sync_publish_hook(self, hook: Callable[[Event], Any]) -> None:
+        # Copy-on-write so publish can iterate the tuple without snapshotting it.
+        self._hooks = self._hooks + ((hook, False),)
+
+    def add_async_publish_hook(self, hook: Callable[[Event], Awaitable[Any]]) -> None:
+        self._hooks = self._hooks + ((hook, True),)
 
     def qsize(self) -> int:
         return self._queue.qsize()
 
+    def _stamp(self, event: Union[Event, Dict[str, Any]]) -> Event:
+        queue_index = next(self._counter)
+        if type(event) is Event:
+            return self._normalize_event(event, queue_index)
+        return self._normalize(event, queue_index)
+
     @staticmethod
     def _normalize(event: Union[Event, Dict[str, Any]], queue_index: int) -> Event:
         if isinstance(event, Event):
-            payload = dict(event.payload)
-            payload.setdefault("queue_index", queue_index)
-            return Event(
-                type=event.type,
-                timestamp=event.timestamp or EventBus._iso_now(),
-                origin_id=event.origin_id,
-                payload=payload,
-            )
+            return EventBus._normalize_event(event, queue_index)
+        return EventBus._normalize_dict(event, queue_index)
 
+    @staticmethod
+    def _normalize_event(event: Event, queue_index: int) -> Event:
+        # Stamping goes into a new payload: the caller's Event (and its payload dict) may be
+        # published again and must not keep this queue_index.
+        payload = event.payload
+        if "queue_index" in payload and event.timestamp:
+            return event
+        if "queue_index" not in payload:
+            payload = {**payload, "queue_index": queue_index}
+        return Event(
+            type=event.type,
+            timestamp=event.timestamp or EventBus._iso_now(),
+            origin_id=event.origin_id,
+            payload=payload,
+        )
+
+    @staticmethod
+    def _normalize_dict(event: Dict[str, Any], queue_index: int) -> Event:
         raw_type = event.get("type")
         if isinstance(raw_type, EventType):
             event_type = raw_type
         elif isinstance(raw_type, str) and raw_type.strip():
-            event_type = EventType(raw_type.strip())
+            event_type = EventType._value2member_map_.get(raw_type) or EventType(raw_type.strip())
         else:
             raise ValueError("Event must include a valid 'type'.")
 
@@ -134,4 +212,4 @@ class EventBus:
 
     @staticmethod
     def _iso_now() -> str:
-        return datetime.now(timezone.utc).isoformat()
+        return _now(_UTC).isoformat()
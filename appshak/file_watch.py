@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# inotify(7) masks.
+_IN_MODIFY = 0x00000002
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+# A file appearing in the directory (created or renamed in), e.g. a stop marker.
+CREATE_MASK = _IN_MOVED_TO | _IN_CREATE
+# A file appearing or being written, e.g. a log being followed.
+CHANGE_MASK = _IN_MODIFY | CREATE_MASK
+
+# struct inotify_event header: wd, mask, cookie, len; the NUL-padded name follows.
+_EVENT_HEADER = struct.Struct("iIII")
+
+_libc: Optional[Any] = None
+
+
+def _load_libc() -> Optional[Any]:
+    global _libc
+    if _libc is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        except OSError:
+            return None
+        if hasattr(libc, "inotify_init1") and hasattr(libc, "inotify_add_watch"):
+            _libc = libc
+    return _libc
+
+
+class DirectoryWatcher:
+    """Wake on changes inside one directory: inotify on Linux, interval polling elsewhere."""
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        poll_interval: float,
+        mask: int = CHANGE_MASK,
+        names: Optional[Iterable[str]] = None,
+    ) -> None:
+        """``mask`` selects the inotify events; ``names`` limits wakeups to those file names."""
+        self.directory = Path(directory)
+        self.poll_interval = max(0.01, float(poll_interval))
+        self.mask = mask
+        self._names = frozenset(os.fsencode(name) for name in names) if names is not None else None
+        self._changed = asyncio.Event()
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def native(self) -> bool:
+        return self._fd is not None
+
+    def start(self) -> None:
+        """Attach to the running loop; silently stays in polling mode when inotify is unavailable."""
+        libc = _load_libc()
+        if libc is None or self._fd is not None:
+            return
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return
+        if libc.inotify_add_watch(fd, os.fsencode(str(self.directory)), self.mask) < 0:
+            os.close(fd)
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_reader(fd, self._on_readable)
+        except (NotImplementedError, RuntimeError):
+            os.close(fd)
+            return
+        self._fd = fd
+        self._loop = loop
+
+    async def wait_for_change(
+        self,
+        timeout: Optional[float] = None,
+        *,
+        stop_event: Optional[asyncio.Event] = None,
+    ) -> None:
+        """Return after a change notification, or after the poll interval in polling mode.
+
+        Also returns as soon as ``stop_event`` is set. Callers re-check the state they
+        care about afterwards; spurious returns are allowed.
+        """
+        if stop_event is None:
+            await self._wait_for_change(timeout)
+            return
+        if stop_event.is_set():
+            return
+        change = asyncio.ensure_future(self._wait_for_change(timeout))
+        stopped = asyncio.ensure_future(stop_event.wait())
+        try:
+            await asyncio.wait({change, stopped}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in (change, stopped):
+                if not waiter.done():
+                    waiter.cancel()
+
+    async def _wait_for_change(self, timeout: Optional[float]) -> None:
+        if self._fd is None:
+            await asyncio.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
+
+    def close(self) -> None:
+        if self._fd is None:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = None
+        self._loop = None
+
+    def _on_readable(self) -> None:
+        relevant = False
+        try:
+            while True:
+                data = os.read(self._fd, 4096)
+                if not data:
+                    break
+                relevant = relevant or self._is_relevant(data)
+        except BlockingIOError:
+            pass
+        except OSError:
+            return
+        if relevant:
+            self._changed.set()
+
+    def _is_relevant(self, data: bytes) -> bool:
+        """Whether a read of whole inotify_event records touches a watched name."""
+        if self._names is None:
+            return True
+        offset = 0
+        header_size = _EVENT_HEADER.size
+        while offset + header_size <= len(data):
+            _, event_mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += header_size
+            name = data[offset : offset + name_len].split(b"\0", 1)[0]
+            offset += name_len
+            if event_mask & _IN_Q_OVERFLOW or name in self._names:
+                return True
+        return False
@@ -2,20 +2,46 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from types import CoroutineType
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Final, Iterable, List, Optional
 
 from appshak.agents.builder import BuilderAgent
 from appshak.agents.chief import ChiefAgent
 from appshak.agents.scout import ScoutAgent
-from appshak.event_bus import EventBus, EventType
+from appshak.event_bus import Event, EventBus, EventType
+from appshak.file_watch import CREATE_MASK, DirectoryWatcher
 from appshak.memory import GlobalMemory
-from appshak.plugins.interfaces import AppShakPlugin
-from appshak.plugins.loader import PluginLoadError, PluginLoader
 from appshak.plugins.runtime import KernelStateView
 from appshak.safeguards import SafeguardMonitor
 
+if TYPE_CHECKING:
+    from appshak.plugins.interfaces import AppShakPlugin
+    from appshak.plugins.loader import PluginLoadError, PluginLoader
+
+_UTC = timezone.utc
+_now = datetime.now
+
+# Plain-string event types, resolved once instead of through the Enum descriptor per use.
+_EV_START: Final = EventType.KERNEL_START.value
+_EV_SHUTDOWN: Final = EventType.KERNEL_SHUTDOWN.value
+_EV_ERROR: Final = EventType.KERNEL_ERROR.value
+_EV_RECOVERY: Final = EventType.KERNEL_RECOVERY.value
+_EV_VIOLATION: Final = EventType.CONSTITUTION_VIOLATION.value
+_EVENT_TYPES_BY_VALUE = EventType._value2member_map_
+
+
+@lru_cache(maxsize=512)
+def _resolve_optional_method(owner: type, methods: tuple[str, ...]) -> Optional[str]:
+    """First of ``methods`` defined as a callable on ``owner``, memoized per class."""
+    for method in methods:
+        if callable(getattr(owner, method, None)):
+            return method
+    return None
+
 
 class AppShakKernel:
     """Root orchestrator; kernel owns lifecycle and heartbeat."""
@@ -25,9 +51,39 @@ class AppShakKernel:
         "increase its own autonomy/influence through perpetual self-improvement."
     )
 
-    PROPOSAL_EVENT = EventType.PROPOSAL.value
-    EXTERNAL_ACTION_REQUEST_EVENT = EventType.EXTERNAL_ACTION_REQUEST.value
-    CONSTITUTION_VIOLATION_EVENT = EventType.CONSTITUTION_VIOLATION.value
+    PROPOSAL_EVENT: Final = EventType.PROPOSAL.value
+    EXTERNAL_ACTION_REQUEST_EVENT: Final = EventType.EXTERNAL_ACTION_REQUEST.value
+    CONSTITUTION_VIOLATION_EVENT: Final = _EV_VIOLATION
+    # Events routed per heartbeat cycle before maintenance and persistence run.
+    MAX_EVENT_BATCH = 64
+
+    __slots__ = (
+        "config",
+        "running",
+        "_stop_event",
+        "_wakeup",
+        "heartbeat_interval",
+        "shutdown_grace_seconds",
+        "idle_poll_timeout",
+        "event_bus",
+        "_bus_get_nowait",
+        "_bus_notifies",
+        "tool_gateway",
+        "global_memory",
+        "safeguards",
+        "_plugin_loader",
+        "plugins",
+        "plugin_load_errors",
+        "_plugin_state_view",
+        "agents",
+        "_agent_tasks",
+        "_heartbeat_task",
+        "_emergency_watch_task",
+        "_pipeline_locks",
+        "_heartbeat_failures",
+        "_recovered_state",
+        "_emergency_stop_file",
+    )
 
     def __init__(
         self,
@@ -39,10 +95,27 @@ class AppShakKernel:
     ):
         self.config = config
         self.running = False
+        self._stop_event = asyncio.Event()
+        # Set by every publish (and by stop) so the heartbeat sleeps until there is work.
+        self._wakeup = asyncio.Event()
         self.heartbeat_interval = float(config.get("heartbeat_interval", 15))
-        self.idle_poll_timeout = float(config.get("event_poll_timeout", 1.0))
-
-        self.event_bus = event_bus if event_bus is not None else EventBus()
+        # How long shutdown waits for loops to exit on their own before cancelling them.
+        self.shutdown_grace_seconds = float(config.get("shutdown_grace_seconds", 5.0))
+        poll_timeout = config.get("event_poll_timeout", 1.0)
+        # None disables idle scans: the heartbeat then waits for an event indefinitely.
+        self.idle_poll_timeout: Optional[float] = None if poll_timeout is None else float(poll_timeout)
+
+        self.event_bus = (
+            event_bus
+            if event_bus is not None
+            else EventBus(maxsize=int(config.get("event_queue_maxsize", 0)))
+        )
+        # DurableEventBus has no get_nowait; _poll_event falls back to get_next(timeout=0).
+        bus_get_nowait = getattr(self.event_bus, "get_nowait", None)
+        self._bus_get_nowait = bus_get_nowait if callable(bus_get_nowait) else None
+        # Only the in-process bus sees every publish; events other processes append to a
+        # DurableEventBus never reach _on_event_published, so that bus is polled instead.
+        self._bus_notifies = isinstance(self.event_bus, EventBus)
         self.tool_gateway = tool_gateway
         self.global_memory = GlobalMemory(config)
         self.safeguards = SafeguardMonitor(config)
@@ -53,10 +126,15 @@ class AppShakKernel:
             modules = list(plugin_modules)
         else:
             modules = []
-        self._plugin_loader = plugin_loader or PluginLoader(
-            modules,
-            plugin_config=plugin_config if isinstance(plugin_config, dict) else {},
-        )
+        if plugin_loader is None:
+            # Imported here so callers that inject their own loader never load the module.
+            from appshak.plugins.loader import PluginLoader
+
+            plugin_loader = PluginLoader(
+                modules,
+                plugin_config=plugin_config if isinstance(plugin_config, dict) else {},
+            )
+        self._plugin_loader = plugin_loader
         loaded_plugins, load_errors = self._plugin_loader.load()
         self.plugins: List[AppShakPlugin] = loaded_plugins
         self.plugin_load_errors: List[PluginLoadError] = load_errors
@@ -70,52 +148,90 @@ class AppShakKernel:
 
         self._agent_tasks: List[asyncio.Task[Any]] = []
         self._heartbeat_task: Optional[asyncio.Task[Any]] = None
-        self._external_pipeline_lock = asyncio.Lock()
+        self._emergency_watch_task: Optional[asyncio.Task[Any]] = None
+        # origin_id -> [lock, holders+waiters]; entries are dropped when unused.
+        self._pipeline_locks: Dict[str, List[Any]] = {}
         self._heartbeat_failures = 0
         self._recovered_state: Dict[str, Any] = {}
-        self._stop_event = asyncio.Event()
         configured_stop_file = config.get(
             "emergency_stop_file",
             str(self.global_memory.root_dir / "EMERGENCY_STOP"),
         )
         self._emergency_stop_file = Path(configured_stop_file)
 
+    @property
+    def shutdown_event(self) -> asyncio.Event:
+        """Event set when the kernel stops (shutdown or emergency stop)."""
+        return self._stop_event
+
     async def heartbeat(self) -> None:
         """Kernel event loop with constitutional routing."""
+        loop = asyncio.get_running_loop()
+        woken = True
+        # Idle scans run once the heartbeat has gone a full interval without work.
+        quiet_since = loop.time()
         while self.running and not self._stop_event.is_set():
+            # Taken once per cycle and passed explicitly; other tasks keep their own clock.
+            cycle_ts = _now(_UTC).isoformat()
             try:
-                if await self._should_emergency_stop():
-                    await self.request_emergency_stop(
-                        reason="Emergency stop signal detected.",
-                        origin_id="operator",
-                    )
-                    break
-
                 await self._run_plugins(current_event=None)
-                event = await self.event_bus.get_next(timeout=self.idle_poll_timeout)
-
-                if event is None:
-                    await self.agents["recon"].search_for_problems()
-                else:
+                # Clear before draining so a publish during routing re-arms the wakeup.
+                self._wakeup.clear()
+                last_event = None
+                routed = 0
+                while routed < self.MAX_EVENT_BATCH and not self._stop_event.is_set():
+                    event = await self._poll_event()
+                    if event is None:
+                        break
                     await self._run_plugins(current_event=event)
                     await self._route_event(event)
+                    last_event = event
+                    routed += 1
+
+                if routed:
+                    quiet_since = loop.time()
+                    if routed >= self.MAX_EVENT_BATCH:
+                        # Batch cap reached with events possibly left over; run again without sleeping.
+                        self._wakeup.set()
+                elif not woken and self._idle_scan_due(loop.time() - quiet_since):
+                    await self.agents["recon"].search_for_problems()
+                    quiet_since = loop.time()
 
                 await self._post_cycle_maintenance()
-                await self._persist_heartbeat_state(event)
+                await self._persist_heartbeat_state(last_event, cycle_ts)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:  # pragma: no cover - emergency guard
                 self._heartbeat_failures += 1
                 await self._log_kernel_error("heartbeat", exc)
                 await self._recover_after_heartbeat_failure(exc)
-                await asyncio.sleep(5)
+                await self._sleep_unless_stopped(5)
 
             if self._stop_event.is_set():
                 break
             try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=self.heartbeat_interval)
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self._idle_wait_timeout(loop.time() - quiet_since),
+                )
+                woken = True
+                quiet_since = loop.time()
             except asyncio.TimeoutError:
-                pass
+                woken = False
+
+    # Both helpers read the timing attributes on every call so changes apply to a running kernel.
+    def _idle_scan_due(self, quiet_for: float) -> bool:
+        return self.idle_poll_timeout is not None and quiet_for >= self.heartbeat_interval
+
+    def _idle_wait_timeout(self, quiet_for: float) -> Optional[float]:
+        interval = self.heartbeat_interval
+        timeout = None if self.idle_poll_timeout is None else max(0.0, interval - quiet_for)
+        if not self._bus_notifies:
+            # Bounded so events appended elsewhere are still claimed: the configured poll
+            # timeout, or the heartbeat interval when idle scans are off.
+            poll = interval if self.idle_poll_timeout is None else self.idle_poll_timeout
+            timeout = poll if timeout is None else min(timeout, poll)
+        return timeout
 
     async def start(self) -> None:
         if self.running:
@@ -125,22 +241,26 @@ class AppShakKernel:
         await self._recover_from_persisted_state()
         self.running = True
         await self._publish_system_event(
-            EventType.KERNEL_START.value,
+            _EV_START,
             {"started_at": self._iso_now()},
         )
 
-        self._agent_tasks = [
-            asyncio.create_task(self._run_agent(agent_id), name=f"agent-{agent_id}")
-            for agent_id in self.agents
-        ]
-        self._heartbeat_task = asyncio.create_task(self.heartbeat(), name="kernel-heartbeat")
-
-        results = await asyncio.gather(
-            *self._agent_tasks,
-            self._heartbeat_task,
-            return_exceptions=True,
-        )
-        await self._record_task_failures(results)
+        # The group owns every agent loop plus the heartbeat: agents return once
+        # shutdown_event is set, and cancelling start() cancels all of them.
+        try:
+            async with asyncio.TaskGroup() as group:
+                self._agent_tasks = [
+                    group.create_task(self._run_agent(agent_id), name=f"agent-{agent_id}")
+                    for agent_id in self.agents
+                ]
+                self._heartbeat_task = group.create_task(self.heartbeat(), name="kernel-heartbeat")
+                self._emergency_watch_task = group.create_task(
+                    self._watch_emergency_stop(),
+                    name="kernel-emergency-stop",
+                )
+        except* Exception as failures:
+            await self._record_task_failures(failures.exceptions)
+        await self._flush_memory(("flush_logs",))
 
     async def shutdown(self) -> None:
         if not self.running and not self._agent_tasks and self._heartbeat_task is None:
@@ -148,8 +268,9 @@ class AppShakKernel:
 
         self.running = False
         self._stop_event.set()
+        self._wakeup.set()
         await self._publish_system_event(
-            EventType.KERNEL_SHUTDOWN.value,
+            _EV_SHUTDOWN,
             {"stopped_at": self._iso_now()},
         )
 
@@ -157,39 +278,50 @@ class AppShakKernel:
             await self._call_optional(agent, ("shutdown",))
 
         tasks = [task for task in self._agent_tasks if not task.done()]
-        if self._heartbeat_task and not self._heartbeat_task.done():
-            tasks.append(self._heartbeat_task)
+        for task in (self._heartbeat_task, self._emergency_watch_task):
+            if task and not task.done():
+                tasks.append(task)
 
-        for task in tasks:
-            task.cancel()
         if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-        await self._call_optional(self.global_memory, ("persist_all", "periodic_persist"))
+            # Every loop exits on its own once shutdown_event is set; only stragglers are cancelled.
+            _, pending = await asyncio.wait(tasks, timeout=self.shutdown_grace_seconds)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        await self._flush_memory(("persist_all", "periodic_persist"))
         self._agent_tasks = []
         self._heartbeat_task = None
+        self._emergency_watch_task = None
 
     async def _route_event(self, event: Any) -> None:
+        # Convert once; every helper below reads from this dict.
+        evt = self._event_to_dict(event)
+        event_type = self._event_type_value(evt)
+
+        # Written before routing so a routing failure still leaves the consumption record.
+        # The full event is already in the log as EVENT_PUBLISHED; queue_index links the two.
+        payload = self._event_payload(evt)
         await self._call_optional(
             self.global_memory,
             ("append_global_log",),
             "EVENT_CONSUMED",
-            self._event_to_dict(event),
+            {
+                "type": event_type,
+                "origin_id": self._event_origin(evt),
+                "queue_index": payload.get("queue_index") if isinstance(payload, dict) else None,
+            },
         )
 
-        if not await self._event_is_compliant(event):
+        if not await self._event_is_compliant(evt):
             return
-
-        event_type = self._event_type_value(event)
-
         if event_type == self.PROPOSAL_EVENT:
             decision = await self.agents["command"].arbitrate(event)
             if decision is not None:
                 await self.event_bus.publish(decision)
-            return
-
-        if event_type == self.EXTERNAL_ACTION_REQUEST_EVENT:
-            await self._process_external_action_pipeline(event)
+        elif event_type == self.EXTERNAL_ACTION_REQUEST_EVENT:
+            await self._process_external_action_pipeline(event, evt)
 
     async def _post_cycle_maintenance(self) -> None:
         for agent in self.agents.values():
@@ -197,15 +329,23 @@ class AppShakKernel:
         await self._call_optional(self.safeguards, ("run_diagnostics",))
         await self._call_optional(self.global_memory, ("periodic_persist",))
 
-    async def _process_external_action_pipeline(self, event: Any) -> None:
+    async def _process_external_action_pipeline(
+        self,
+        event: Any,
+        request: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """Atomic external-action flow: REQUEST -> CHIEF_APPROVAL -> SAFEGUARD_CHECK -> EXECUTE -> LOG_RESULT."""
-        async with self._external_pipeline_lock:
+        if request is None:
             request = self._event_to_dict(event)
-            origin_id = self._event_origin(event)
+        origin_id = self._event_origin(request)
+        async with self._pipeline_lock(origin_id):
+            # One timestamp for the whole atomic pipeline run.
+            pipeline_ts = self._iso_now()
 
             await self._log_external_stage(
                 stage="REQUEST",
                 origin_id=origin_id,
+                timestamp=pipeline_ts,
                 details={"request": request},
             )
 
@@ -213,6 +353,7 @@ class AppShakKernel:
             await self._log_external_stage(
                 stage="CHIEF_APPROVAL",
                 origin_id=origin_id,
+                timestamp=pipeline_ts,
                 details={"request": request, "approval": approval},
             )
             if not bool(isinstance(approval, dict) and approval.get("approved")):
@@ -224,19 +365,28 @@ class AppShakKernel:
                 await self._log_external_stage(
                     stage="LOG_RESULT",
                     origin_id=origin_id,
+                    timestamp=pipeline_ts,
                     details=result_payload,
                 )
                 await self.agents["command"].handle_external_action(result_payload)
                 return
 
-            safeguard_check = await self.safeguards.check_request(event, origin_id=origin_id)
+            # Derived once so every stage sees the request exactly as it was checked.
+            facts = self.safeguards.derive_facts(event, origin_id)
+            safeguard_check = await self.safeguards.check_request(event, origin_id=origin_id, facts=facts)
             await self._log_external_stage(
                 stage="SAFEGUARD_CHECK",
                 origin_id=origin_id,
+                timestamp=pipeline_ts,
                 details={"request": request, "safeguard_check": safeguard_check},
             )
             if not bool(safeguard_check.get("allowed")):
-                attempt_state = await self.safeguards.record_attempt(event, origin_id=origin_id, success=False)
+                attempt_state = await self.safeguards.record_attempt(
+                    event,
+                    origin_id=origin_id,
+                    success=False,
+                    facts=facts,
+                )
                 result_payload = {
                     "status": "blocked_by_safeguard",
                     "request": request,
@@ -255,24 +405,30 @@ class AppShakKernel:
                 await self._log_external_stage(
                     stage="LOG_RESULT",
                     origin_id=origin_id,
+                    timestamp=pipeline_ts,
                     details=result_payload,
                 )
                 await self.agents["command"].handle_external_action(result_payload)
                 return
 
-            execution = await self.safeguards.execute_in_sandbox(event, origin_id=origin_id)
+            execution = await self.safeguards.execute_in_sandbox(event, origin_id=origin_id, facts=facts)
             await self._log_external_stage(
                 stage="EXECUTE",
                 origin_id=origin_id,
+                timestamp=pipeline_ts,
                 details={"request": request, "execution": execution},
             )
+            succeeded = bool(execution.get("success"))
             attempt_state = await self.safeguards.record_attempt(
                 event,
                 origin_id=origin_id,
-                success=bool(execution.get("success")),
+                success=succeeded,
+                facts=facts,
             )
+            # result_payload outlives this call (published result, persisted pipeline
+            # state), so it is always a fresh dict and never pooled or reused.
             result_payload = {
-                "status": "executed" if bool(execution.get("success")) else "execution_denied",
+                "status": "executed" if succeeded else "execution_denied",
                 "request": request,
                 "approval": approval,
                 "safeguard_check": safeguard_check,
@@ -282,39 +438,66 @@ class AppShakKernel:
             await self._log_external_stage(
                 stage="LOG_RESULT",
                 origin_id=origin_id,
+                timestamp=pipeline_ts,
                 details=result_payload,
             )
             await self._call_optional(
                 self.global_memory,
                 ("save_external_pipeline_state",),
-                {"last_result": result_payload, "updated_at": self._iso_now()},
+                {"last_result": result_payload, "updated_at": pipeline_ts},
             )
             await self.agents["command"].handle_external_action(result_payload)
 
-    async def _log_external_stage(self, stage: str, origin_id: str, details: Dict[str, Any]) -> None:
+    @asynccontextmanager
+    async def _pipeline_lock(self, origin_id: str) -> AsyncIterator[None]:
+        """Serialize pipeline runs per origin; different origins proceed in parallel."""
+        entry = self._pipeline_locks.get(origin_id)
+        if entry is None:
+            entry = self._pipeline_locks[origin_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._pipeline_locks[origin_id]
+
+    async def _log_external_stage(
+        self,
+        stage: str,
+        origin_id: str,
+        details: Dict[str, Any],
+        timestamp: Optional[str] = None,
+    ) -> None:
         await self._call_optional(
             self.global_memory,
             ("log_external_action",),
             stage,
             {
                 "origin_id": origin_id,
-                "timestamp": self._iso_now(),
+                "timestamp": timestamp or self._iso_now(),
                 **details,
             },
         )
 
     async def _run_agent(self, agent_id: str) -> None:
         agent = self.agents[agent_id]
-        while self.running and not self._stop_event.is_set():
+        while not self._stop_event.is_set():
             try:
                 await agent.run()
-                if self.running:
+                if not self._stop_event.is_set():
                     raise RuntimeError(f"Agent {agent_id} exited unexpectedly.")
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
                 await self._log_kernel_error(f"agent:{agent_id}", exc)
-                await asyncio.sleep(2)
+                await self._sleep_unless_stopped(2)
+
+    async def _poll_event(self) -> Optional[Any]:
+        if self._bus_get_nowait is not None:
+            return self._bus_get_nowait()
+        return await self.event_bus.get_next(timeout=0)
 
     async def _run_plugins(self, current_event: Optional[Any]) -> None:
         if not self.plugins:
@@ -329,21 +512,43 @@ class AppShakKernel:
                 plugin_name = getattr(plugin, "name", plugin.__class__.__name__)
                 await self._log_kernel_error(f"plugin:{plugin_name}", exc)
 
+    async def _flush_memory(self, methods: tuple[str, ...]) -> None:
+        # A failed log write is recorded as an error rather than raised out of start()/shutdown().
+        try:
+            await self._call_optional(self.global_memory, methods)
+        except Exception as exc:
+            await self._call_optional(self.global_memory, ("record_error",), "memory_flush", repr(exc))
+
     async def _record_task_failures(self, results: Iterable[Any]) -> None:
         for result in results:
             if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
                 await self._log_kernel_error("task_failure", result)
 
     async def _on_event_published(self, event: Any) -> None:
-        await self._call_optional(
-            self.global_memory,
-            ("append_global_log",),
-            "EVENT_PUBLISHED",
-            self._event_to_dict(event),
-        )
+        self._wakeup.set()
+        evt = self._event_to_dict(event)
+        try:
+            # Recorded first: the bus swallows hook errors, so a failing global-log write
+            # must not be able to drop the errors.jsonl entry.
+            if evt.get("type") == _EV_ERROR and evt.get("origin_id") == "kernel":
+                payload = self._event_payload(evt)
+                await self._call_optional(
+                    self.global_memory,
+                    ("record_error",),
+                    str(payload.get("source", "kernel")),
+                    str(payload.get("error", "")),
+                    payload.get("timestamp"),
+                )
+        finally:
+            await self._call_optional(
+                self.global_memory,
+                ("append_global_log",),
+                "EVENT_PUBLISHED",
+                evt,
+            )
 
-    async def _event_is_compliant(self, event: Any) -> bool:
-        payload = self._event_payload(event)
+    async def _event_is_compliant(self, evt: Dict[str, Any]) -> bool:
+        payload = self._event_payload(evt)
         justification = payload.get("prime_directive_justification") if isinstance(payload, dict) else None
         if isinstance(justification, str) and justification.strip():
             return True
@@ -352,41 +557,52 @@ class AppShakKernel:
             self.CONSTITUTION_VIOLATION_EVENT,
             {
                 "reason": "Missing Prime Directive justification on event",
-                "event_type": self._event_type_value(event),
-                "origin_id": self._event_origin(event),
+                "event_type": self._event_type_value(evt),
+                "origin_id": self._event_origin(evt),
             },
         )
         return False
 
     async def _publish_system_event(self, event_type: str, payload: Dict[str, Any]) -> None:
-        system_payload = dict(payload)
-        system_payload.setdefault(
+        # Callers always pass a freshly built dict, so it becomes the event payload as-is.
+        payload.setdefault(
             "prime_directive_justification",
             "Kernel governance action preserves safe, continuous operation under the Prime Directive.",
         )
-        event = {
-            "type": event_type,
-            "origin_id": "kernel",
-            "timestamp": self._iso_now(),
-            "payload": system_payload,
-        }
-        await self.event_bus.publish(event)
-
-    async def _log_kernel_error(self, source: str, error: Exception) -> None:
-        await self._call_optional(self.global_memory, ("log_error",), source, repr(error))
-        await self._publish_system_event(
-            EventType.KERNEL_ERROR.value,
-            {"source": source, "error": repr(error), "timestamp": self._iso_now()},
+        await self.event_bus.publish(
+            Event(
+                type=_EVENT_TYPES_BY_VALUE.get(event_type) or EventType(event_type),
+                timestamp=self._iso_now(),
+                origin_id="kernel",
+                payload=payload,
+            )
         )
 
-    async def _persist_heartbeat_state(self, event: Any) -> None:
-        event_type = self._event_type_value(event) if event is not None else "IDLE"
+    async def _log_kernel_error(self, source: str, error: Exception) -> None:
+        # The KERNEL_ERROR publish hook writes errors.jsonl; the global log gets the
+        # event itself, so there is no separate ERROR line.
+        try:
+            await self._publish_system_event(
+                _EV_ERROR,
+                {"source": source, "error": repr(error), "timestamp": self._iso_now()},
+            )
+        except Exception:
+            # The bus itself may be what failed; still get the error on disk.
+            await self._call_optional(self.global_memory, ("log_error",), source, repr(error))
+
+    async def _persist_heartbeat_state(self, event: Any, timestamp: str) -> None:
+        if event is None:
+            event_type = "IDLE"
+        elif isinstance(event, Event):
+            event_type = event.type._value_
+        else:
+            event_type = self._event_type_value(self._event_to_dict(event))
         await self._call_optional(
             self.global_memory,
             ("save_kernel_state",),
             {
                 "running": self.running,
-                "last_heartbeat_at": self._iso_now(),
+                "last_heartbeat_at": timestamp,
                 "last_event_type": event_type,
                 "heartbeat_failures": self._heartbeat_failures,
             },
@@ -399,7 +615,7 @@ class AppShakKernel:
             kernel_state = loaded.get("kernel_state", {})
             if isinstance(kernel_state, dict) and kernel_state:
                 await self._publish_system_event(
-                    EventType.KERNEL_RECOVERY.value,
+                    _EV_RECOVERY,
                     {
                         "recovered_at": self._iso_now(),
                         "recovered_kernel_state": kernel_state,
@@ -412,7 +628,7 @@ class AppShakKernel:
         if isinstance(loaded, dict):
             recovered_kernel_state = loaded.get("kernel_state", {}) if isinstance(loaded.get("kernel_state"), dict) else {}
             await self._publish_system_event(
-                EventType.KERNEL_RECOVERY.value,
+                _EV_RECOVERY,
                 {
                     "recovered_at": self._iso_now(),
                     "heartbeat_error": repr(error),
@@ -424,9 +640,10 @@ class AppShakKernel:
         if self._stop_event.is_set():
             return
         self._stop_event.set()
+        self._wakeup.set()
         self.running = False
         await self._publish_system_event(
-            EventType.CONSTITUTION_VIOLATION.value,
+            _EV_VIOLATION,
             {
                 "reason": f"EMERGENCY_STOP: {reason}",
                 "origin_id": origin_id,
@@ -505,31 +722,88 @@ class AppShakKernel:
         default: Any = None,
         **kwargs: Any,
     ) -> Any:
-        for method in methods:
-            func = getattr(obj, method, None)
-            if callable(func):
-                res = func(*args, **kwargs)
-                if inspect.isawaitable(res):
-                    return await res
-                return res
-        return default
+        method = None
+        if type(methods) is tuple:
+            method = _resolve_optional_method(type(obj), methods)
+        if method is not None:
+            func = getattr(obj, method)
+        else:
+            # Slow path: attributes set on the instance, or non-tuple method lists.
+            for candidate in methods:
+                func = getattr(obj, candidate, None)
+                if callable(func):
+                    break
+            else:
+                return default
+        res = func(*args, **kwargs)
+        if type(res) is CoroutineType or (res is not None and inspect.isawaitable(res)):
+            return await res
+        return res
 
     def _event_to_dict(self, event: Any) -> Dict[str, Any]:
+        # Events are immutable and shared, so their payload is referenced rather than copied.
+        if isinstance(event, Event):
+            return event._as_dict_view()
         return event.to_dict() if hasattr(event, "to_dict") else dict(event)
 
-    def _event_payload(self, event: Any) -> Dict[str, Any]:
-        return self._event_to_dict(event).get("payload", {})
+    # The accessors below take the dict from _event_to_dict, converted once per event.
+    @staticmethod
+    def _event_payload(evt: Dict[str, Any]) -> Dict[str, Any]:
+        return evt.get("payload", {})
 
-    def _event_type_value(self, event: Any) -> str:
-        evt = self._event_to_dict(event)
+    @staticmethod
+    def _event_type_value(evt: Dict[str, Any]) -> str:
         return str(evt.get("type", ""))
 
-    def _event_origin(self, event: Any) -> str:
-        evt = self._event_to_dict(event)
+    @staticmethod
+    def _event_origin(evt: Dict[str, Any]) -> str:
         return str(evt.get("origin_id", "unknown"))
 
     def _iso_now(self) -> str:
-        return datetime.now(timezone.utc).isoformat()
-
-    async def _should_emergency_stop(self) -> bool:
-        return await asyncio.to_thread(self._emergency_stop_file.exists)
+        return _now(_UTC).isoformat()
+
+    async def _watch_emergency_stop(self) -> None:
+        """Stop the kernel once the emergency stop file appears.
+
+        Uses inotify on the file's directory where available, otherwise re-checks
+        the file every heartbeat interval; the heartbeat itself never stats it.
+        """
+        # Only the stop file appearing matters; state files rewritten next to it every
+        # heartbeat must not wake this loop.
+        watcher = DirectoryWatcher(
+            self._emergency_stop_file.parent,
+            poll_interval=self.heartbeat_interval,
+            mask=CREATE_MASK,
+            names=(self._emergency_stop_file.name,),
+        )
+        try:
+            if self._emergency_stop_file.parent.is_dir():
+                watcher.start()
+        except OSError as exc:
+            await self._log_kernel_error("emergency_watch", exc)
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    if self._emergency_stop_file.exists():
+                        await self.request_emergency_stop(
+                            reason="Emergency stop signal detected.",
+                            origin_id="operator",
+                        )
+                        return
+                    await watcher.wait_for_change(stop_event=self._stop_event)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    # A failing watch must not take the heartbeat down with it: log it and
+                    # fall back to re-checking the file every heartbeat interval.
+                    await self._log_kernel_error("emergency_watch", exc)
+                    watcher.close()
+                    await self._sleep_unless_stopped(self.heartbeat_interval)
+        finally:
+            watcher.close()
+
+    async def _sleep_unless_stopped(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
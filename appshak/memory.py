@@ -2,11 +2,48 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import re
 from collections import deque
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from appshak.file_watch import DirectoryWatcher
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_line(record: Any) -> bytes:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+    def _dumps_document(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+
+else:  # pragma: no cover - exercised only without orjson installed
+    _loads = json.loads
+
+    def _dumps_line(record: Any) -> bytes:
+        return (json.dumps(record, ensure_ascii=True) + "\n").encode("ascii")
+
+    def _dumps_document(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=True, indent=2).encode("ascii")
+
+_UNSAFE_AGENT_ID_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
+@lru_cache(maxsize=256)
+def _safe_agent_id(agent_id: str) -> str:
+    # Agent ids repeat on every append_agent_event, so the substitution is memoized.
+    return _UNSAFE_AGENT_ID_CHARS.sub("_", agent_id) or "agent"
 
 
 class GlobalMemory:
@@ -22,82 +59,120 @@ class GlobalMemory:
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self.agents_dir.mkdir(parents=True, exist_ok=True)
 
+        # Legacy single-file snapshot; migrated into the partitions and logs on the first
+        # load_state that finds no partition files.
         self.store_path = self.root_dir / "memory_store.json"
+        # Hot state sections persisted independently, so a heartbeat rewrites only its own file.
+        # Errors and agent events are durable through their JSONL logs; load_state rebuilds
+        # the capped in-memory history from the tails of those logs.
+        self.partition_paths: Dict[str, Path] = {
+            "kernel_state": self.root_dir / "kernel_state.json",
+            "external_pipeline": self.root_dir / "external_pipeline.json",
+        }
         self.global_log_path = self.logs_dir / "global.jsonl"
         self.error_log_path = self.logs_dir / "errors.jsonl"
         self.external_action_log_path = self.logs_dir / "external_actions.jsonl"
 
-        self._state_lock = asyncio.Lock()
+        # In-memory history is capped; the JSONL logs keep the full record.
+        self.max_errors_in_memory = max(1, int(config.get("max_in_memory_errors", 1024)))
+        self.max_agent_events_in_memory = max(1, int(config.get("max_agent_events_in_memory", 2048)))
+
+        # Writers swap in new top-level/sub-dicts under this lock; readers take
+        # a reference to self._state without locking. The errors and agent event
+        # deques are append-only, so they are extended in place.
+        self._state_write_lock = asyncio.Lock()
         self._file_lock = asyncio.Lock()
-        self._agent_locks: Dict[str, asyncio.Lock] = {}
+        # One queue + writer task per JSONL file; appends never wait on disk I/O.
+        self._log_queues: Dict[Path, asyncio.Queue[bytes]] = {}
+        self._log_writers: Dict[Path, asyncio.Task[None]] = {}
+        # First failed write per log since the last flush of that log.
+        self._log_write_errors: Dict[Path, Exception] = {}
         self._state: Dict[str, Any] = {
             "updated_at": self._iso_now(),
-            "errors": [],
+            "errors": deque(maxlen=self.max_errors_in_memory),
             "agent_namespaces": {},
             "kernel_state": {},
             "external_pipeline": {},
         }
+        self._dirty: set[str] = set()
 
     async def log_error(self, source: str, message: str) -> None:
+        await self.record_error(source, message)
+        await self.append_global_log("ERROR", {"source": source, "message": message})
+
+    async def record_error(self, source: str, message: str, timestamp: Optional[str] = None) -> None:
+        """Record an error in memory and errors.jsonl only (no global log line)."""
         record = {
-            "timestamp": self._iso_now(),
+            "timestamp": timestamp or self._iso_now(),
             "source": source,
             "message": message,
         }
-        async with self._state_lock:
+        async with self._state_write_lock:
             self._state["errors"].append(record)
-            self._state["updated_at"] = self._iso_now()
+            self._state["updated_at"] = record["timestamp"]
 
         await self._append_json_line(self.error_log_path, record)
-        await self.append_global_log("ERROR", {"source": source, "message": message})
 
     async def periodic_persist(self) -> None:
         await self._persist_state()
 
     async def persist_all(self) -> None:
-        await self._persist_state()
+        try:
+            await self.flush_logs()
+        finally:
+            # A failed log write must not also cost the dirty state sections.
+            await self._persist_state()
+
+    async def flush_logs(self) -> None:
+        """Wait until every queued log line has been written; re-raise a failed write."""
+        first_error: Optional[Exception] = None
+        for path in list(self._log_queues):
+            try:
+                await self._flush_log(path)
+            except Exception as error:
+                first_error = first_error or error
+        if first_error is not None:
+            raise first_error
 
     async def load_state(self) -> Dict[str, Any]:
-        if not self.store_path.exists():
-            return dict(self._state)
-
+        # History is rebuilt from the logs, so lines still queued must land first.
+        for path in list(self._log_queues):
+            await self._join_log_queue(path)
         async with self._file_lock:
-            raw_text = await asyncio.to_thread(self.store_path.read_text, "utf-8")
-
-        try:
-            loaded = json.loads(raw_text)
-        except json.JSONDecodeError:
-            return dict(self._state)
-
-        if not isinstance(loaded, dict):
-            return dict(self._state)
-
-        async with self._state_lock:
-            self._state = {
-                "updated_at": loaded.get("updated_at", self._iso_now()),
-                "errors": loaded.get("errors", []),
-                "agent_namespaces": loaded.get("agent_namespaces", {}),
-                "kernel_state": loaded.get("kernel_state", {}),
-                "external_pipeline": loaded.get("external_pipeline", {}),
-            }
-            return dict(self._state)
+            loaded, migrated_legacy = await asyncio.to_thread(self._read_persisted_sections)
+
+        async with self._state_write_lock:
+            self._state = {**self._state, **loaded}
+            if migrated_legacy:
+                self._dirty.update(self.partition_paths)
+            snapshot = dict(self._state)
+        if migrated_legacy:
+            # Write every partition now so later loads never fall back to the legacy store.
+            await self._persist_state()
+        return snapshot
 
     async def save_kernel_state(self, kernel_state: Dict[str, Any]) -> None:
-        async with self._state_lock:
-            current = self._state.setdefault("kernel_state", {})
-            current.update(kernel_state)
-            self._state["updated_at"] = self._iso_now()
+        async with self._state_write_lock:
+            state = self._state
+            current = state.get("kernel_state")
+            merged = {**current, **kernel_state} if isinstance(current, dict) else dict(kernel_state)
+            self._state = {**state, "kernel_state": merged, "updated_at": self._iso_now()}
+            self._dirty.add("kernel_state")
         await self._persist_state()
 
     async def get_kernel_state(self) -> Dict[str, Any]:
-        async with self._state_lock:
-            state = self._state.get("kernel_state", {})
-            return dict(state) if isinstance(state, dict) else {}
+        # kernel_state is replaced, never mutated, so the reference is a stable snapshot.
+        state = self._state.get("kernel_state", {})
+        return dict(state) if isinstance(state, dict) else {}
 
     async def save_external_pipeline_state(self, pipeline_state: Dict[str, Any]) -> None:
-        async with self._state_lock:
-            self._state["external_pipeline"] = dict(pipeline_state)
-            self._state["updated_at"] = self._iso_now()
+        async with self._state_write_lock:
+            self._state = {
+                **self._state,
+                "external_pipeline": dict(pipeline_state),
+                "updated_at": self._iso_now(),
+            }
+            self._dirty.add("external_pipeline")
         await self._persist_state()
 
     async def tail_log(
@@ -106,6 +181,8 @@ class GlobalMemory:
         lines: int = 25,
     ) -> List[str]:
         path = self._log_path(log_name)
+        # Reads wait for queued lines but leave write failures to the next flush.
+        await self._join_log_queue(path)
         if not path.exists():
             return []
         return await asyncio.to_thread(self._tail_file_lines, path, max(1, lines))
@@ -115,25 +192,31 @@ class GlobalMemory:
         log_name: str = "global",
         *,
         start_from_end: bool = True,
-        poll_interval: float = 0.5,
+        poll_interval: float = 1.0,
         stop_event: Optional[asyncio.Event] = None,
     ) -> AsyncIterator[str]:
+        """Follow a log file, waking on inotify events (poll_interval is the non-Linux fallback)."""
         path = self._log_path(log_name)
         path.parent.mkdir(parents=True, exist_ok=True)
         if not path.exists():
             path.touch()
 
-        with path.open("r", encoding="utf-8") as handle:
-            if start_from_end:
-                handle.seek(0, 2)
-            while True:
-                if stop_event is not None and stop_event.is_set():
-                    return
-                line = handle.readline()
-                if line:
-                    yield line.rstrip("\n")
-                else:
-                    await asyncio.sleep(poll_interval)
+        watcher = DirectoryWatcher(path.parent, poll_interval=poll_interval, names=(path.name,))
+        watcher.start()
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                if start_from_end:
+                    handle.seek(0, 2)
+                while True:
+                    if stop_event is not None and stop_event.is_set():
+                        return
+                    line = handle.readline()
+                    if line:
+                        yield line.rstrip("\n")
+                    else:
+                        await watcher.wait_for_change(stop_event=stop_event)
+        finally:
+            watcher.close()
 
     async def load_published_events_for_replay(
         self,
@@ -143,29 +226,10 @@ class GlobalMemory:
     ) -> List[Dict[str, Any]]:
         allowed_types = {str(item) for item in include_types} if include_types is not None else None
         path = self.global_log_path
+        await self._join_log_queue(path)
         if not path.exists():
             return []
-
-        selected: deque[Dict[str, Any]] = deque(maxlen=max(1, limit))
-        with path.open("r", encoding="utf-8") as handle:
-            for raw in handle:
-                line = raw.strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if rec.get("event_type") != "EVENT_PUBLISHED":
-                    continue
-                payload = rec.get("payload", {})
-                if not isinstance(payload, dict):
-                    continue
-                event_type = str(payload.get("type", ""))
-                if allowed_types is not None and event_type not in allowed_types:
-                    continue
-                selected.append(payload)
-        return list(selected)
+        return await asyncio.to_thread(self._collect_replay_events, path, max(1, limit), allowed_types)
 
     async def append_global_log(self, event_type: str, payload: Dict[str, Any]) -> None:
         await self._append_json_line(
@@ -181,17 +245,37 @@ class GlobalMemory:
             "payload": event,
         }
 
-        async with self._state_lock:
-            namespace = self._state["agent_namespaces"].setdefault(
-                safe_agent_id, {"events": [], "updated_at": self._iso_now()}
-            )
-            namespace["events"].append(agent_record)
-            namespace["updated_at"] = self._iso_now()
-            self._state["updated_at"] = self._iso_now()
+        timestamp = agent_record["timestamp"]
+
+        async with self._state_write_lock:
+            state = self._state
+            namespaces = state["agent_namespaces"]
+            namespace = namespaces.get(safe_agent_id)
+            if namespace is None:
+                namespace = self._new_agent_namespace(timestamp)
+                namespaces = {**namespaces, safe_agent_id: namespace}
+                state = {**state, "agent_namespaces": namespaces}
+                self._state = state
+            namespace["timestamps"].append(timestamp)
+            namespace["event_types"].append("AGENT_EVENT")
+            namespace["payloads"].append(event)
+            namespace["updated_at"] = timestamp
+            state["updated_at"] = timestamp
 
         path = self.agents_dir / f"{safe_agent_id}.jsonl"
-        lock = self._agent_locks.setdefault(safe_agent_id, asyncio.Lock())
-        await self._append_json_line(path, agent_record, lock=lock)
+        await self._append_json_line(path, agent_record)
+
+    def iter_agent_events(self, agent_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield the agent's in-memory events as ``{timestamp, event_type, payload}`` dicts."""
+        namespace = self._state["agent_namespaces"].get(self._sanitize_agent_id(agent_id))
+        if namespace is None:
+            return iter(())
+        # Snapshot the columns so appends made while the caller iterates do not break zip.
+        columns = (tuple(namespace["timestamps"]), tuple(namespace["event_types"]), tuple(namespace["payloads"]))
+        return (
+            {"timestamp": timestamp, "event_type": event_type, "payload": payload}
+            for timestamp, event_type, payload in zip(*columns)
+        )
 
     async def log_external_action(self, stage: str, payload: Dict[str, Any]) -> None:
         await self._append_json_line(
@@ -200,30 +284,215 @@ class GlobalMemory:
         )
 
     async def _persist_state(self) -> None:
-        async with self._state_lock:
-            self._state["updated_at"] = self._iso_now()
-            snapshot = json.dumps(self._state, ensure_ascii=True, indent=2)
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        state = self._state
+        # No await between grabbing the reference and dumping it, so no lock is needed.
+        writes = [
+            (self.partition_paths[section], _dumps_document(state.get(section, {})))
+            for section in sorted(dirty)
+        ]
 
-        async with self._file_lock:
-            await asyncio.to_thread(self.store_path.write_text, snapshot, "utf-8")
+        try:
+            async with self._file_lock:
+                await asyncio.to_thread(self._write_sections, writes)
+        except Exception:
+            self._dirty.update(dirty)
+            raise
+
+    def _new_agent_namespace(self, updated_at: str) -> Dict[str, Any]:
+        # Events are stored as parallel columns rather than one dict per event.
+        maxlen = self.max_agent_events_in_memory
+        return {
+            "timestamps": deque(maxlen=maxlen),
+            "event_types": deque(maxlen=maxlen),
+            "payloads": deque(maxlen=maxlen),
+            "updated_at": updated_at,
+        }
 
-    async def _append_json_line(
-        self,
-        path: Path,
-        record: Dict[str, Any],
-        *,
-        lock: asyncio.Lock | None = None,
-    ) -> None:
-        line = json.dumps(record, ensure_ascii=True) + "\n"
-        use_lock = lock or self._file_lock
-        async with use_lock:
-            await asyncio.to_thread(self._write_line, path, line)
+    def _read_persisted_sections(self) -> tuple[Dict[str, Any], bool]:
+        """Load partitions (or migrate the legacy store) and rebuild history from the logs."""
+        loaded: Dict[str, Any] = {}
+        for section, path in self.partition_paths.items():
+            value = self._read_json_file(path)
+            if isinstance(value, dict):
+                loaded[section] = value
+
+        migrated_legacy = False
+        if not loaded:
+            legacy = self._read_json_file(self.store_path)
+            if isinstance(legacy, dict):
+                for section in ("updated_at", "kernel_state", "external_pipeline"):
+                    if section in legacy:
+                        loaded[section] = legacy[section]
+                self._seed_logs_from_legacy(legacy)
+                migrated_legacy = True
+
+        loaded["errors"] = deque(
+            self._read_jsonl_tail(self.error_log_path, self.max_errors_in_memory),
+            maxlen=self.max_errors_in_memory,
+        )
+        loaded["agent_namespaces"] = self._read_agent_namespaces()
+        return loaded, migrated_legacy
+
+    def _read_agent_namespaces(self) -> Dict[str, Any]:
+        namespaces: Dict[str, Any] = {}
+        for path in sorted(self.agents_dir.glob("*.jsonl")):
+            records = self._read_jsonl_tail(path, self.max_agent_events_in_memory)
+            if not records:
+                continue
+            namespace = self._new_agent_namespace(str(records[-1].get("timestamp", "")))
+            for record in records:
+                namespace["timestamps"].append(record.get("timestamp"))
+                namespace["event_types"].append(record.get("event_type"))
+                namespace["payloads"].append(record.get("payload"))
+            namespaces[path.stem] = namespace
+        return namespaces
+
+    def _seed_logs_from_legacy(self, legacy: Dict[str, Any]) -> None:
+        """Copy legacy errors/agent events into their JSONL logs when those logs hold nothing yet."""
+        errors = legacy.get("errors")
+        if isinstance(errors, list):
+            self._seed_log(self.error_log_path, [record for record in errors if isinstance(record, dict)])
+        namespaces = legacy.get("agent_namespaces")
+        if isinstance(namespaces, dict):
+            for agent_id, namespace in namespaces.items():
+                if isinstance(namespace, dict):
+                    path = self.agents_dir / f"{self._sanitize_agent_id(agent_id)}.jsonl"
+                    self._seed_log(path, self._legacy_agent_records(namespace))
+
+    def _seed_log(self, path: Path, records: List[Dict[str, Any]]) -> None:
+        if not records or (path.exists() and path.stat().st_size > 0):
+            return
+        self._write_lines(path, [_dumps_line(record) for record in records])
+
+    @staticmethod
+    def _legacy_agent_records(namespace: Dict[str, Any]) -> List[Dict[str, Any]]:
+        events = namespace.get("events")
+        if isinstance(events, list):
+            return [record for record in events if isinstance(record, dict)]
+        columns = [namespace.get(key) for key in ("timestamps", "event_types", "payloads")]
+        if all(isinstance(column, list) for column in columns):
+            return [
+                {"timestamp": timestamp, "event_type": event_type, "payload": payload}
+                for timestamp, event_type, payload in zip(*columns)
+            ]
+        return []
+
+    @staticmethod
+    def _read_jsonl_tail(path: Path, limit: int) -> List[Dict[str, Any]]:
+        if not path.exists():
+            return []
+        records: List[Dict[str, Any]] = []
+        for raw in GlobalMemory._reverse_read_lines(path):
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+                if len(records) >= limit:
+                    break
+        records.reverse()
+        return records
+
+    @staticmethod
+    def _read_json_file(path: Path) -> Any:
+        try:
+            return _loads(path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            return None
 
     @staticmethod
-    def _write_line(path: Path, line: str) -> None:
+    def _write_sections(writes: List[tuple[Path, bytes]]) -> None:
+        for path, data in writes:
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            with tmp_path.open("wb") as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, path)
+
+    async def _append_json_line(self, path: Path, record: Dict[str, Any]) -> None:
+        line = _dumps_line(record)
+        queue = self._log_queues.get(path)
+        writer = self._log_writers.get(path)
+        if queue is None or writer is None or writer.done():
+            queue = asyncio.Queue()
+            self._log_queues[path] = queue
+            self._log_writers[path] = asyncio.create_task(
+                self._run_log_writer(path, queue),
+                name=f"memory-log-writer:{path.name}",
+            )
+        queue.put_nowait(line)
+
+    async def _flush_log(self, path: Path) -> None:
+        """Wait for queued lines, then raise the first write failure since the last flush."""
+        await self._join_log_queue(path)
+        error = self._log_write_errors.pop(path, None)
+        if error is not None:
+            raise error
+
+    async def _join_log_queue(self, path: Path) -> None:
+        queue = self._log_queues.get(path)
+        writer = self._log_writers.get(path)
+        if queue is not None and writer is not None and not writer.done():
+            await queue.join()
+
+    async def _run_log_writer(self, path: Path, queue: asyncio.Queue[bytes]) -> None:
+        loop = asyncio.get_running_loop()
+        in_flight: Optional[asyncio.Future[None]] = None
+        try:
+            while True:
+                batch = [await queue.get()]
+                batch.extend(self._drain_queue(queue))
+                in_flight = loop.run_in_executor(None, self._write_lines, path, batch)
+                try:
+                    # Shielded so a cancelled writer still knows when its thread write lands.
+                    await asyncio.shield(in_flight)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as error:
+                    # Keep later appends flowing; the failure is raised from the next flush.
+                    # The traceback is dropped so the stored error does not pin this frame.
+                    self._log_write_errors.setdefault(path, error.with_traceback(None))
+                in_flight = None
+                for _ in batch:
+                    queue.task_done()
+        except asyncio.CancelledError:
+            # Loop teardown: let the batch already in a thread land, then write whatever is
+            # still queued after it rather than losing it.
+            if in_flight is not None:
+                try:
+                    await in_flight
+                except Exception as error:
+                    self._log_write_errors.setdefault(path, error.with_traceback(None))
+            leftover = self._drain_queue(queue)
+            if leftover:
+                try:
+                    self._write_lines(path, leftover)
+                except OSError as error:
+                    self._log_write_errors.setdefault(path, error.with_traceback(None))
+            raise
+
+    @staticmethod
+    def _drain_queue(queue: asyncio.Queue[bytes]) -> List[bytes]:
+        drained: List[bytes] = []
+        while True:
+            try:
+                drained.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return drained
+
+    @staticmethod
+    def _write_lines(path: Path, lines: List[bytes]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as file_handle:
-            file_handle.write(line)
+        with path.open("ab") as file_handle:
+            file_handle.writelines(lines)
 
     def _log_path(self, log_name: str) -> Path:
         normalized = log_name.strip().lower()
@@ -237,16 +506,64 @@ class GlobalMemory:
 
     @staticmethod
     def _tail_file_lines(path: Path, lines: int) -> List[str]:
-        tail: deque[str] = deque(maxlen=lines)
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                tail.append(line.rstrip("\n"))
-        return list(tail)
+        tail = list(islice(GlobalMemory._reverse_read_lines(path), lines))
+        tail.reverse()
+        return tail
+
+    @staticmethod
+    def _collect_replay_events(
+        path: Path,
+        limit: int,
+        allowed_types: Optional[set[str]],
+    ) -> List[Dict[str, Any]]:
+        # Scan newest-first and stop at the limit instead of parsing the whole log.
+        selected: List[Dict[str, Any]] = []
+        for raw in GlobalMemory._reverse_read_lines(path):
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                rec = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            if rec.get("event_type") != "EVENT_PUBLISHED":
+                continue
+            payload = rec.get("payload", {})
+            if not isinstance(payload, dict):
+                continue
+            event_type = str(payload.get("type", ""))
+            if allowed_types is not None and event_type not in allowed_types:
+                continue
+            selected.append(payload)
+            if len(selected) >= limit:
+                break
+        selected.reverse()
+        return selected
+
+    @staticmethod
+    def _reverse_read_lines(path: Path, block_size: int = 64 * 1024) -> Iterator[str]:
+        """Yield the lines of a file last-to-first, reading fixed-size blocks from the end."""
+        with path.open("rb") as handle:
+            position = handle.seek(0, os.SEEK_END)
+            if position == 0:
+                return
+            handle.seek(position - 1)
+            if handle.read(1) == b"\n":
+                position -= 1
+            leftover = b""
+            while position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                handle.seek(position)
+                parts = (handle.read(read_size) + leftover).split(b"\n")
+                leftover = parts[0]
+                for part in reversed(parts[1:]):
+                    yield part.removesuffix(b"\r").decode("utf-8", errors="replace")
+            yield leftover.removesuffix(b"\r").decode("utf-8", errors="replace")
 
     @staticmethod
     def _sanitize_agent_id(agent_id: str) -> str:
-        cleaned = re.sub(r"[^A-Za-z0-9_-]", "_", str(agent_id))
-        return cleaned or "agent"
+        return _safe_agent_id(str(agent_id))
 
     @staticmethod
     def _iso_now() -> str:
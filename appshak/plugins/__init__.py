@@ -1,7 +1,8 @@
 """Plugin runtime contracts and loading utilities."""
 
+from typing import Any
+
 from appshak.plugins.interfaces import AppShakPlugin, StateView
-from appshak.plugins.loader import PluginLoadError, PluginLoader
 
 __all__ = [
     "AppShakPlugin",
@@ -10,3 +11,11 @@ __all__ = [
     "PluginLoader",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    # The loader is only needed when plugins are actually loaded, so import it on first use.
+    if name in ("PluginLoadError", "PluginLoader"):
+        from appshak.plugins import loader
+
+        return getattr(loader, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
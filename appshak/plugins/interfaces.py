@@ -6,7 +6,7 @@ from typing import Any, Dict, Protocol
 class StateView(Protocol):
     """Restricted plugin-facing access to kernel state and event emission."""
 
-    def snapshot(self) -> Dict[str, Any]:
+    def snapshot(self, *, include_event: bool = True) -> Dict[str, Any]:
         ...
 
     async def emit_event(self, event: Dict[str, Any]) -> Any:
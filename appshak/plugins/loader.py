@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 import importlib
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from appshak.plugins.interfaces import AppShakPlugin
 
+_MISSING = object()
+
+# Requested plugin name -> (module name, module) resolved by an earlier load(). An entry is
+# only trusted while sys.modules still holds that same module object, so a reloaded or
+# replaced module is resolved again. Failed resolutions are never kept.
+_RESOLVED_MODULES: Dict[str, Tuple[str, ModuleType]] = {}
+
+
+def _import_cached(module_name: str) -> ModuleType:
+    # sys.modules first, so repeated load() calls skip the import machinery and its lock.
+    return sys.modules.get(module_name) or importlib.import_module(module_name)
+
 
 @dataclass(slots=True)
 class PluginLoadError:
@@ -28,61 +42,83 @@ class PluginLoader:
     def load(self) -> Tuple[List[AppShakPlugin], List[PluginLoadError]]:
         plugins: List[AppShakPlugin] = []
         errors: List[PluginLoadError] = []
+        load_one = self._load_one
+        add_plugin = plugins.append
+        add_error = errors.append
         for requested_name in self.module_names:
-            loaded, error = self._load_one(requested_name)
+            loaded, error = load_one(requested_name)
             if loaded is not None:
-                plugins.append(loaded)
+                add_plugin(loaded)
             elif error is not None:
-                errors.append(error)
+                add_error(error)
         return plugins, errors
 
     def _load_one(self, requested_name: str) -> Tuple[Optional[AppShakPlugin], Optional[PluginLoadError]]:
+        resolved = _RESOLVED_MODULES.get(requested_name)
+        if resolved is not None and sys.modules.get(resolved[0]) is resolved[1]:
+            return self._load_from_module(requested_name, *resolved)
+
         tried: List[str] = []
+        import_module = _import_cached
         for module_name in self._module_candidates(requested_name):
             tried.append(module_name)
             try:
-                module = importlib.import_module(module_name)
-            except Exception as exc:
-                last_error = exc
+                module = import_module(module_name)
+            except Exception:
                 continue
-
-            factory = getattr(module, "create_plugin", None)
-            if not callable(factory):
-                return None, PluginLoadError(
-                    module_name=requested_name,
-                    error=f"Module '{module_name}' is missing callable create_plugin(config).",
-                )
-
-            config = (
-                self.plugin_config.get(requested_name)
-                or self.plugin_config.get(module_name)
-                or {}
-            )
-            try:
-                plugin = factory(config)
-            except Exception as exc:
-                return None, PluginLoadError(
-                    module_name=requested_name,
-                    error=f"create_plugin failed for '{module_name}': {exc}",
-                )
-
-            if not hasattr(plugin, "dispatch") or not callable(getattr(plugin, "dispatch", None)):
-                return None, PluginLoadError(
-                    module_name=requested_name,
-                    error=f"Plugin '{module_name}' does not implement dispatch(state_view).",
-                )
-            if not hasattr(plugin, "name"):
-                return None, PluginLoadError(
-                    module_name=requested_name,
-                    error=f"Plugin '{module_name}' does not expose name.",
-                )
-            return plugin, None
+            return self._load_from_module(requested_name, module_name, module)
 
         return None, PluginLoadError(
             module_name=requested_name,
             error=f"Could not import plugin module. Tried: {tried}",
         )
 
+    def _load_from_module(
+        self,
+        requested_name: str,
+        module_name: str,
+        module: ModuleType,
+    ) -> Tuple[Optional[AppShakPlugin], Optional[PluginLoadError]]:
+        factory = getattr(module, "create_plugin", None)
+        if not callable(factory):
+            _RESOLVED_MODULES.pop(requested_name, None)
+            return None, PluginLoadError(
+                module_name=requested_name,
+                error=f"Module '{module_name}' is missing callable create_plugin(config).",
+            )
+        _RESOLVED_MODULES[requested_name] = (module_name, module)
+        return self._create_plugin(requested_name, module_name, factory)
+
+    def _create_plugin(
+        self,
+        requested_name: str,
+        module_name: str,
+        factory: Callable[..., Any],
+    ) -> Tuple[Optional[AppShakPlugin], Optional[PluginLoadError]]:
+        config_for = self.plugin_config.get
+        config = config_for(requested_name) or config_for(module_name) or {}
+        try:
+            plugin = factory(config)
+        except Exception as exc:
+            return None, PluginLoadError(
+                module_name=requested_name,
+                error=f"create_plugin failed for '{module_name}': {exc}",
+            )
+
+        # Checked on every instance: an instance attribute can shadow what the class
+        # provides. One sentinel getattr per attribute instead of hasattr + getattr.
+        if not callable(getattr(plugin, "dispatch", _MISSING)):
+            return None, PluginLoadError(
+                module_name=requested_name,
+                error=f"Plugin '{module_name}' does not implement dispatch(state_view).",
+            )
+        if getattr(plugin, "name", _MISSING) is _MISSING:
+            return None, PluginLoadError(
+                module_name=requested_name,
+                error=f"Plugin '{module_name}' does not expose name.",
+            )
+        return plugin, None
+
     @staticmethod
     def _module_candidates(requested_name: str) -> List[str]:
         if "." in requested_name:
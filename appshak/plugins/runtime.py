@@ -3,6 +3,9 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+_UTC = timezone.utc
+_now = datetime.now
+
 
 class KernelStateView:
     """Kernel-bound StateView implementation used by plugins."""
@@ -14,7 +17,8 @@ class KernelStateView:
     def set_current_event(self, event: Optional[Any]) -> None:
         self._current_event = event
 
-    def snapshot(self) -> Dict[str, Any]:
+    def snapshot(self, *, include_event: bool = True) -> Dict[str, Any]:
+        """Kernel status for plugins; ``include_event=False`` skips copying the current event."""
         queue_size = 0
         qsize = getattr(self._kernel.event_bus, "qsize", None)
         if callable(qsize):
@@ -23,22 +27,20 @@ class KernelStateView:
             except Exception:
                 queue_size = 0
 
-        current_event = self._current_event
-        event_dict = None
-        if current_event is not None:
-            event_dict = (
-                current_event.to_dict()
-                if hasattr(current_event, "to_dict")
-                else dict(current_event)
-            )
-
         return {
             "running": bool(self._kernel.running),
             "event_queue_size": queue_size,
-            "current_event": event_dict,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "current_event": self.current_event_dict() if include_event else None,
+            "timestamp": _now(_UTC).isoformat(),
         }
 
+    def current_event_dict(self) -> Optional[Dict[str, Any]]:
+        """A fresh dict copy of the event being routed this cycle, or None."""
+        current_event = self._current_event
+        if current_event is None:
+            return None
+        return current_event.to_dict() if hasattr(current_event, "to_dict") else dict(current_event)
+
     async def emit_event(self, event: Dict[str, Any]) -> Any:
         if not isinstance(event, dict):
             raise TypeError("StateView.emit_event requires a dict event payload.")
@@ -51,7 +53,7 @@ class KernelStateView:
         raw = {
             "type": event.get("type"),
             "origin_id": event.get("origin_id") or "plugin",
-            "timestamp": event.get("timestamp") or datetime.now(timezone.utc).isoformat(),
+            "timestamp": event.get("timestamp") or _now(_UTC).isoformat(),
             "payload": normalized_payload,
         }
         return await self._kernel.event_bus.publish(raw)
@@ -1,12 +1,35 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from urllib.parse import urlparse
 
 
+@lru_cache(maxsize=1024)
+def _normalize_host(url: str) -> str:
+    # Requests keep hitting the same few endpoints, so the urlparse result is memoized.
+    try:
+        return urlparse(url).netloc or url
+    except Exception:
+        return url
+
+
+@lru_cache(maxsize=256)
+def _iso_from_ts(ts: float) -> str:
+    # A cooldown deadline is re-reported on every status check until it expires.
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+class _RequestFacts(NamedTuple):
+    payload: Dict[str, Any]
+    endpoint: str
+    action_key: str
+
+
 class SafeguardMonitor:
     """Security governor for external action gating and sandbox execution."""
 
@@ -27,33 +50,47 @@ class SafeguardMonitor:
         "usd",
         "eur",
     }
+    # Same substring semantics as scanning for each keyword, in one regex pass.
+    _MONETARY_RE = re.compile("|".join(re.escape(kw) for kw in sorted(_MONETARY_KEYWORDS)), re.IGNORECASE)
 
-    _SHELL_FIELDS = {"command", "shell", "shell_command", "exec", "script", "process"}
-    _SAFE_METHODS = {"SIMULATE", "NOOP"}
+    _SHELL_FIELDS = frozenset({"command", "shell", "shell_command", "exec", "script", "process"})
+    _SAFE_METHODS = frozenset({"SIMULATE", "NOOP"})
 
     def __init__(self, config: Dict[str, Any]) -> None:
         self.config = config
         self.retry_max = int(config.get("safeguard_retry_max", 3))
         self.cooldown_seconds = int(config.get("cooldown_timer_seconds", config.get("safeguard_cooldown_seconds", 60)))
         configured = config.get("endpoint_whitelist", [])
-        self.endpoint_whitelist = {
-            self._normalize_host(str(item))
+        self.endpoint_whitelist = frozenset(
+            _normalize_host(str(item))
             for item in configured
             if str(item).strip()
-        }
+        )
 
         self._lock = asyncio.Lock()
-        self._attempt_state: Dict[str, Dict[str, float]] = {}
+        # Per action key; a key absent from either dict means zero retries / no cooldown.
+        self._retries: Dict[str, int] = {}
+        # (monotonic deadline, wall-clock deadline): the first decides, the second is only reported.
+        self._cooldown_until: Dict[str, Tuple[float, float]] = {}
         self.allow_real_world_impact = bool(config.get("allow_real_world_impact", False))
 
     async def run_diagnostics(self) -> bool:
         async with self._lock:
             return self.retry_max > 0 and self.cooldown_seconds >= 0
 
-    async def check_request(self, event: Any, origin_id: str) -> Dict[str, Any]:
+    def derive_facts(self, event: Any, origin_id: str) -> _RequestFacts:
+        """Derive payload, endpoint and action key once for the pipeline stages of one request."""
         payload = self._payload(event)
         endpoint = self._extract_endpoint(payload)
-        action_key = self._action_key(payload, origin_id, endpoint)
+        return _RequestFacts(payload, endpoint, self._action_key(payload, origin_id, endpoint))
+
+    async def check_request(
+        self,
+        event: Any,
+        origin_id: str,
+        facts: Optional[_RequestFacts] = None,
+    ) -> Dict[str, Any]:
+        payload, endpoint, action_key = facts if facts is not None else self.derive_facts(event, origin_id)
         method = str(payload.get("method", "SIMULATE")).upper()
         simulate_flag = payload.get("simulate")
 
@@ -131,10 +168,14 @@ class SafeguardMonitor:
             "origin_id": origin_id,
         }
 
-    async def execute_in_sandbox(self, event: Any, origin_id: str) -> Dict[str, Any]:
+    async def execute_in_sandbox(
+        self,
+        event: Any,
+        origin_id: str,
+        facts: Optional[_RequestFacts] = None,
+    ) -> Dict[str, Any]:
         """Sandbox executor: no shell, no monetary actions, no unrestricted execution."""
-        payload = self._payload(event)
-        endpoint = self._extract_endpoint(payload)
+        payload, endpoint, _ = facts if facts is not None else self.derive_facts(event, origin_id)
         action = str(payload.get("action", "external_action"))
         method = str(payload.get("method", "SIMULATE")).upper()
         simulate_flag = payload.get("simulate")
@@ -190,48 +231,49 @@ class SafeguardMonitor:
             "method": method,
         }
 
-    async def record_attempt(self, event: Any, origin_id: str, success: bool) -> Dict[str, Any]:
-        payload = self._payload(event)
-        endpoint = self._extract_endpoint(payload)
-        action_key = self._action_key(payload, origin_id, endpoint)
-
+    async def record_attempt(
+        self,
+        event: Any,
+        origin_id: str,
+        success: bool,
+        facts: Optional[_RequestFacts] = None,
+    ) -> Dict[str, Any]:
+        action_key = (facts if facts is not None else self.derive_facts(event, origin_id)).action_key
+
+        retries_by_key = self._retries
+        cooldowns = self._cooldown_until
         async with self._lock:
-            now = time.time()
-            state = self._attempt_state.setdefault(action_key, {"retries": 0.0, "cooldown_until": 0.0})
-
             if success:
-                state["retries"] = 0.0
-                state["cooldown_until"] = 0.0
+                retries_by_key.pop(action_key, None)
+                cooldowns.pop(action_key, None)
+                retries = 0
+                cooldown_until = 0.0
             else:
-                state["retries"] = float(int(state.get("retries", 0.0)) + 1)
-                if int(state["retries"]) >= self.retry_max:
-                    state["cooldown_until"] = now + self.cooldown_seconds
-                    state["retries"] = float(self.retry_max)
-
-            cooldown_until = float(state.get("cooldown_until", 0.0))
-            return {
-                "action_key": action_key,
-                "retries": int(state.get("retries", 0.0)),
-                "cooldown_until": (
-                    datetime.fromtimestamp(cooldown_until, tz=timezone.utc).isoformat()
-                    if cooldown_until > 0
-                    else None
-                ),
-            }
+                retries = retries_by_key.get(action_key, 0) + 1
+                if retries >= self.retry_max:
+                    retries = self.retry_max
+                    cooldown = self.cooldown_seconds
+                    cooldowns[action_key] = (time.monotonic() + cooldown, time.time() + cooldown)
+                retries_by_key[action_key] = retries
+                cooldown_until = cooldowns.get(action_key, (0.0, 0.0))[1]
+
+        # Formatting happens after the lock is released.
+        return {
+            "action_key": action_key,
+            "retries": retries,
+            "cooldown_until": _iso_from_ts(cooldown_until) if cooldown_until > 0 else None,
+        }
 
     async def _cooldown_status(self, action_key: str) -> Dict[str, Any]:
-        async with self._lock:
-            state = self._attempt_state.setdefault(action_key, {"retries": 0.0, "cooldown_until": 0.0})
-            now = time.time()
-            cooldown_until = float(state.get("cooldown_until", 0.0))
-            return {
-                "in_cooldown": cooldown_until > now,
-                "cooldown_until": (
-                    datetime.fromtimestamp(cooldown_until, tz=timezone.utc).isoformat()
-                    if cooldown_until > 0
-                    else None
-                ),
-            }
+        # Read-only and await-free, so no lock: record_attempt cannot interleave.
+        deadlines = self._cooldown_until.get(action_key)
+        if deadlines is None:
+            return {"in_cooldown": False, "cooldown_until": None}
+        # Wall-clock jumps (NTP, manual changes) cannot shorten or extend a cooldown.
+        return {
+            "in_cooldown": deadlines[0] > time.monotonic(),
+            "cooldown_until": _iso_from_ts(deadlines[1]),
+        }
 
     def _payload(self, event: Any) -> Dict[str, Any]:
         return event.to_dict().get("payload", {}) if hasattr(event, "to_dict") else event.get("payload", {})
@@ -244,18 +286,35 @@ class SafeguardMonitor:
         return f"{origin_id}:{action}:{endpoint}"
 
     def _contains_monetary_operation(self, payload: Dict[str, Any]) -> bool:
-        text = str(payload).lower()
-        return any(kw in text for kw in self._MONETARY_KEYWORDS)
+        # Scan keys and string values in place (nested ones included) instead of
+        # rendering the whole payload to one string; stops at the first match.
+        search = self._MONETARY_RE.search
+        pending: List[Any] = [payload]
+        seen: set[int] = set()
+        while pending:
+            value = pending.pop()
+            if isinstance(value, str):
+                if search(value) is not None:
+                    return True
+            elif isinstance(value, (dict, list, tuple, set, frozenset)):
+                if id(value) in seen:
+                    continue
+                seen.add(id(value))
+                if isinstance(value, dict):
+                    pending.extend(value.keys())
+                    pending.extend(value.values())
+                else:
+                    pending.extend(value)
+            elif value is not None and not isinstance(value, (bool, int, float)):
+                # Other objects are still checked through their text form, as before.
+                if search(str(value)) is not None:
+                    return True
+        return False
 
     def _contains_shell_execution(self, payload: Dict[str, Any]) -> bool:
-        return any(k in payload for k in self._SHELL_FIELDS)
-
-    def _normalize_host(self, url: str) -> str:
-        try:
-            return urlparse(url).netloc or url
-        except Exception:
-            return url
+        # Any shell field present counts, whatever its value; isdisjoint runs in C.
+        return not self._SHELL_FIELDS.isdisjoint(payload)
 
     def _is_whitelisted(self, endpoint: str) -> bool:
-        host = self._normalize_host(endpoint)
-        return host in self.endpoint_whitelist
+        whitelist = self.endpoint_whitelist
+        return bool(whitelist) and _normalize_host(endpoint) in whitelist
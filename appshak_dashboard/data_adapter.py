@@ -1,9 +1,28 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
+from itertools import accumulate
+from math import sqrt
 from pathlib import Path
-from statistics import mean, stdev
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Sprints scoring below this reliability count as collapsed.
+_COLLAPSE_THRESHOLD = 40.0
+
+
+@lru_cache(maxsize=8)
+def _parse_results_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a results file once per (path, mtime, size); read/parse errors are not cached."""
+    # Both parsers take bytes, so the file is never decoded to str first.
+    return _loads(Path(path).read_bytes())
 
 
 class DashboardDataAdapter:
@@ -29,26 +48,32 @@ class DashboardDataAdapter:
         if not isinstance(per_sprint, list):
             per_sprint = []
 
-        reliability_series = [self._to_float(row.get("reliability")) for row in per_sprint if isinstance(row, dict)]
-        variance_series = [self._to_float(row.get("variance")) for row in per_sprint if isinstance(row, dict)]
-        sprint_labels = [str(row.get("sprint_id", i + 1)) for i, row in enumerate(per_sprint) if isinstance(row, dict)]
+        reliability_series: List[float] = []
+        variance_series: List[float] = []
+        sprint_labels: List[str] = []
+        add_reliability = reliability_series.append
+        add_variance = variance_series.append
+        add_label = sprint_labels.append
+        to_float = self._to_float
+        for i, row in enumerate(per_sprint):
+            if not isinstance(row, dict):
+                continue
+            add_reliability(to_float(row.get("reliability")))
+            add_variance(to_float(row.get("variance")))
+            add_label(str(row.get("sprint_id", i + 1)))
         rolling_reliability = self._rolling_mean(reliability_series, window=max(1, int(rolling_window)))
 
         summary_block = payload.get("summary", {})
         if not isinstance(summary_block, dict):
             summary_block = {}
 
-        reliability_mean = self._summary_or_calc(summary_block.get("reliability_mean"), reliability_series)
-        reliability_std = self._summary_or_calc(
-            summary_block.get("reliability_std_dev"),
-            reliability_series,
-            use_stdev=True,
-        )
-        variance_mean = self._summary_or_calc(summary_block.get("variance_mean"), variance_series)
-        variance_std = self._summary_or_calc(summary_block.get("variance_std_dev"), variance_series, use_stdev=True)
-        reliability_p05 = self._percentile(reliability_series, 0.05)
-        reliability_p95 = self._percentile(reliability_series, 0.95)
-        collapse_count = sum(1 for score in reliability_series if score < 40.0)
+        rel_mean, rel_std, collapse_count = self._series_stats(reliability_series)
+        var_mean, var_std, _ = self._series_stats(variance_series)
+        reliability_mean = self._summary_or(summary_block.get("reliability_mean"), rel_mean)
+        reliability_std = self._summary_or(summary_block.get("reliability_std_dev"), rel_std)
+        variance_mean = self._summary_or(summary_block.get("variance_mean"), var_mean)
+        variance_std = self._summary_or(summary_block.get("variance_std_dev"), var_std)
+        reliability_p05, reliability_p95 = self._percentiles(reliability_series, (0.05, 0.95))
         collapse_rate = (collapse_count / len(reliability_series) * 100.0) if reliability_series else 0.0
 
         config_in = payload.get("pm_config", {})
@@ -84,8 +109,10 @@ class DashboardDataAdapter:
         }
 
     def _read_payload(self) -> Dict[str, Any]:
+        # Dashboards poll a results file that rarely changes; an unchanged file is not re-read.
         try:
-            parsed = json.loads(self.results_path.read_text(encoding="utf-8"))
+            stat = self.results_path.stat()
+            parsed = _parse_results_file(str(self.results_path), stat.st_mtime_ns, stat.st_size)
         except (OSError, ValueError):
             return {}
 
@@ -111,33 +138,52 @@ class DashboardDataAdapter:
     def _rolling_mean(values: List[float], window: int) -> List[float]:
         if not values:
             return []
+        # Prefix sums make each window mean O(1): sum(values[start:idx + 1]) == prefix[idx + 1] - prefix[start].
+        prefix = [0.0, *accumulate(values)]
         output: List[float] = []
         for idx in range(len(values)):
             start = max(0, idx - window + 1)
-            chunk = values[start : idx + 1]
-            output.append(round(mean(chunk), 4))
+            output.append(round((prefix[idx + 1] - prefix[start]) / (idx + 1 - start), 4))
         return output
 
     @staticmethod
-    def _percentile(values: List[float], fraction: float) -> float:
+    def _percentiles(values: List[float], fractions: Iterable[float]) -> List[float]:
+        """Linearly interpolated percentiles for each fraction, sharing a single sort."""
         if not values:
-            return 0.0
+            return [0.0 for _ in fractions]
         ordered = sorted(values)
         if len(ordered) == 1:
-            return ordered[0]
-        pos = (len(ordered) - 1) * max(0.0, min(1.0, fraction))
-        low = int(pos)
-        high = min(low + 1, len(ordered) - 1)
-        alpha = pos - low
-        return ordered[low] * (1.0 - alpha) + ordered[high] * alpha
+            return [ordered[0] for _ in fractions]
+        last = len(ordered) - 1
+        output: List[float] = []
+        for fraction in fractions:
+            pos = last * max(0.0, min(1.0, fraction))
+            low = int(pos)
+            high = min(low + 1, last)
+            alpha = pos - low
+            output.append(ordered[low] * (1.0 - alpha) + ordered[high] * alpha)
+        return output
+
+    @staticmethod
+    def _series_stats(series: List[float]) -> Tuple[float, float, int]:
+        """Mean, sample standard deviation and collapse count in one pass (Welford's update)."""
+        count = 0
+        running_mean = 0.0
+        sq_dev_sum = 0.0
+        collapsed = 0
+        for value in series:
+            count += 1
+            delta = value - running_mean
+            running_mean += delta / count
+            sq_dev_sum += delta * (value - running_mean)
+            if value < _COLLAPSE_THRESHOLD:
+                collapsed += 1
+        std_dev = sqrt(sq_dev_sum / (count - 1)) if count > 1 else 0.0
+        return running_mean, std_dev, collapsed
 
     @staticmethod
-    def _summary_or_calc(source_value: Any, series: List[float], use_stdev: bool = False) -> float:
+    def _summary_or(source_value: Any, computed: float) -> float:
         try:
             return float(source_value)
         except (TypeError, ValueError):
-            if not series:
-                return 0.0
-            if use_stdev:
-                return stdev(series) if len(series) > 1 else 0.0
-            return mean(series)
+            return computed
@@ -4,13 +4,21 @@ import os
 from pathlib import Path
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .data_adapter import DashboardDataAdapter
 
+try:
+    import orjson  # noqa: F401 - ORJSONResponse needs it at render time
+except ImportError:  # pragma: no cover - optional accelerator
+    BaselineResponse = JSONResponse
+else:
+    BaselineResponse = ORJSONResponse
+
 
 BASE_DIR = Path(__file__).resolve().parent
+INDEX_PATH = BASE_DIR / "templates" / "index.html"
 DEFAULT_RESULTS_PATH = "appshak_state/phase2A_results.json"
 RESULTS_PATH = os.getenv("APP_SHAK_RESULTS", DEFAULT_RESULTS_PATH)
 
@@ -25,13 +33,22 @@ app = FastAPI(
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
 
-@app.get("/", response_class=HTMLResponse)
-def home(request: Request) -> HTMLResponse:
-    del request
-    index_path = BASE_DIR / "templates" / "index.html"
-    return HTMLResponse(index_path.read_text(encoding="utf-8"))
+def _index_etag(stat_result: os.stat_result) -> str:
+    """Validator for index.html derived from its stat, so 304 checks never read the file."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
 
 
-@app.get("/api/baseline")
-def baseline() -> dict:
-    return adapter.load_baseline(rolling_window=10)
+@app.get("/", response_class=HTMLResponse)
+def home(request: Request) -> Response:
+    stat_result = INDEX_PATH.stat()
+    etag = _index_etag(stat_result)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    # FileResponse streams the template from disk rather than keeping a copy in process.
+    return FileResponse(INDEX_PATH, media_type="text/html", stat_result=stat_result, headers={"ETag": etag})
+
+
+@app.get("/api/baseline", response_class=BaselineResponse)
+def baseline() -> Response:
+    # The adapter only yields JSON-native values, so skip FastAPI's jsonable_encoder pass.
+    return BaselineResponse(adapter.load_baseline(rolling_window=10))
@@ -1,5 +1,5 @@
 from .arbitration import ArbitrationResult, ArbitrationVote, BoardroomArbitrator
-from .constants import BOARDROOM_DECISION_THRESHOLD, STABILITY_ROLLING_WINDOW
+from .constants import BOARDROOM_DECISION_THRESHOLD, REGISTRY_HISTORY_LIMIT, STABILITY_ROLLING_WINDOW
 from .engine import GovernanceEngine
 from .ledger import GovernanceAuditLedger
 from .projection_adapter import ProjectionOutcomeAdapter
@@ -21,6 +21,7 @@ __all__ = [
     "GovernanceAuditLedger",
     "GovernanceEngine",
     "ProjectionOutcomeAdapter",
+    "REGISTRY_HISTORY_LIMIT",
     "RelationshipWeightEngine",
     "ReplayResult",
     "STABILITY_ROLLING_WINDOW",
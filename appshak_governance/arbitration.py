@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from .constants import BOARDROOM_DECISION_THRESHOLD, BOARDROOM_REASONING_MAX, BOARDROOM_REASONING_MIN
 from .registry import AgentRegistry
 from .utils import as_float, clamp, normalize_agent_id
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ArbitrationVote:
     agent_id: str
     reasoning_score: float
@@ -26,7 +26,7 @@ class ArbitrationVote:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ArbitrationResult:
     target_agent: str
     threshold: float
@@ -34,14 +34,17 @@ class ArbitrationResult:
     approved: bool
     votes: List[ArbitrationVote]
 
-    def as_dict(self) -> Dict[str, object]:
-        return {
+    def as_dict(self, *, include_votes: bool = True) -> Dict[str, object]:
+        """Serialized result; ``include_votes=False`` skips building the per-vote dicts."""
+        payload: Dict[str, object] = {
             "target_agent": self.target_agent,
             "threshold": self.threshold,
             "aggregate_score": self.aggregate_score,
             "approved": self.approved,
-            "votes": [vote.as_dict() for vote in self.votes],
         }
+        if include_votes:
+            payload["votes"] = [vote.as_dict() for vote in self.votes]
+        return payload
 
 
 class BoardroomArbitrator:
@@ -65,9 +68,24 @@ class BoardroomArbitrator:
             )
 
         votes: List[ArbitrationVote] = []
+        total_score = 0.0
+        # (authority, trust in target) per voter, or None for unknown voters; looked up
+        # once per distinct voter rather than once per ballot.
+        voter_factors: Dict[str, Optional[Tuple[float, float]]] = {}
         for ballot in ballots:
             voter_id = normalize_agent_id(ballot.get("agent_id"))
-            if not voter_id or not registry.has_agent(voter_id):
+            if not voter_id:
+                continue
+            if voter_id in voter_factors:
+                factors = voter_factors[voter_id]
+            else:
+                factors = (
+                    (registry.authority_level(voter_id), registry.trust_weight(voter_id, target_id))
+                    if registry.has_agent(voter_id)
+                    else None
+                )
+                voter_factors[voter_id] = factors
+            if factors is None:
                 continue
 
             reasoning_score = clamp(
@@ -75,9 +93,9 @@ class BoardroomArbitrator:
                 BOARDROOM_REASONING_MIN,
                 BOARDROOM_REASONING_MAX,
             )
-            authority_level = registry.authority_level(voter_id)
-            trust_weight = registry.trust_weight(voter_id, target_id)
+            authority_level, trust_weight = factors
             decision_score = reasoning_score * authority_level * trust_weight
+            total_score += decision_score
             votes.append(
                 ArbitrationVote(
                     agent_id=voter_id,
@@ -88,9 +106,7 @@ class BoardroomArbitrator:
                 )
             )
 
-        aggregate_score = 0.0
-        if votes:
-            aggregate_score = sum(vote.decision_score for vote in votes) / float(len(votes))
+        aggregate_score = total_score / float(len(votes)) if votes else 0.0
         approved = aggregate_score >= self.THRESHOLD
         return ArbitrationResult(
             target_agent=target_id,
@@ -12,6 +12,9 @@ TRUST_MAX = 1.0
 REPUTATION_MIN = 0.0
 REPUTATION_MAX = 1.0
 
+# Reputation samples kept per agent; every REGISTRY_UPDATE ledger entry embeds the history.
+REGISTRY_HISTORY_LIMIT = 256
+
 RELATIONSHIP_SUCCESS_STEP = 0.05
 RELATIONSHIP_FAILURE_STEP = 0.07
 RELATIONSHIP_ESCALATION_PENALTY = 0.12
@@ -55,7 +58,7 @@ ESCALATION_EVENT_TYPES = {
 WORKER_STATE_ESCALATED = {"OFFLINE", "RESTARTING"}
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class GovernanceOutcome:
     agent_id: str
     outcome: str
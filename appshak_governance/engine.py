@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 from .arbitration import BoardroomArbitrator
 from .ledger import GovernanceAuditLedger
@@ -9,7 +9,6 @@ from .projection_adapter import ProjectionOutcomeAdapter
 from .registry import AgentRegistry, AgentRegistryStore
 from .relationship import RelationshipWeightEngine
 from .stability import TrustStabilityMetric
-from .utils import canonical_hash
 from .water_cooler import WaterCoolerPropagation
 
 
@@ -34,6 +33,8 @@ class GovernanceEngine:
         self.arbitrator = arbitrator or BoardroomArbitrator()
         self.water_cooler = water_cooler or WaterCoolerPropagation()
         self.stability_metric = stability_metric or TrustStabilityMetric()
+        # (registry, revision) last written through registry_store.
+        self._persisted_marker: Tuple[AgentRegistry, int] | None = None
 
     @classmethod
     def from_agent_definitions(
@@ -67,7 +68,8 @@ class GovernanceEngine:
         outcomes = self.outcome_adapter.derive_outcomes(
             previous_view=previous_view,
             current_view=current,
-            known_agents=self.registry.agent_ids,
+            known_agents=self.registry.agent_id_set,
+            normalized_ids=True,
         )
         trust_changes = self.relationship_engine.apply_outcomes(registry=self.registry, outcomes=outcomes)
         lesson = self.water_cooler.maybe_propagate(
@@ -75,40 +77,40 @@ class GovernanceEngine:
             previous_view=previous_view,
             current_view=current_view,
         )
+        # Everything this tick records goes to the ledger in one batch (one fsync).
+        ledger_entries: List[Tuple[str, Mapping[str, Any], str]] = []
         if lesson.get("triggered"):
             self.registry.record_noop_update(updated_at=timestamp)
-            if self.ledger is not None:
-                self.ledger.append(entry_type="WATER_COOLER_LESSON", payload=lesson, timestamp=timestamp)
+            ledger_entries.append(("WATER_COOLER_LESSON", lesson, timestamp))
 
         stability = self.stability_metric.compute(registry=self.registry)
 
-        for change in trust_changes:
-            if self.ledger is not None:
-                self.ledger.append(entry_type="TRUST_CHANGE", payload=change.as_dict(), timestamp=change.source_timestamp)
+        if self.ledger is not None:
+            for change in trust_changes:
+                ledger_entries.append(("TRUST_CHANGE", change.as_dict(), change.source_timestamp))
 
+        registry_snapshot, registry_hash = self.registry.hashed_snapshot()
         if self.ledger is not None:
-            registry_snapshot = self.registry.snapshot()
-            self.ledger.append(
-                entry_type="REGISTRY_UPDATE",
-                payload={
-                    "registry": registry_snapshot,
-                    "registry_hash": canonical_hash(registry_snapshot),
-                },
-                timestamp=self.registry.last_updated,
-            )
-            self.ledger.append(
-                entry_type="TRUST_STABILITY_METRIC",
-                payload=stability,
-                timestamp=self.registry.last_updated,
+            ledger_entries.append(
+                (
+                    "REGISTRY_UPDATE",
+                    {
+                        "registry": registry_snapshot,
+                        "registry_hash": registry_hash,
+                    },
+                    self.registry.last_updated,
+                )
             )
+            ledger_entries.append(("TRUST_STABILITY_METRIC", stability, self.registry.last_updated))
+            self.ledger.append_batch(ledger_entries)
 
-        persisted_registry = self.registry.snapshot()
         if self.registry_store is not None:
-            persisted_registry = self.registry_store.save_atomic(persisted_registry)
+            self._persist_registry_payload()
 
         return {
-            "registry": persisted_registry,
-            "registry_hash": canonical_hash(persisted_registry),
+            # The hashed snapshot is shared with the registry's cache; callers get their own copy.
+            "registry": self.registry.snapshot(),
+            "registry_hash": registry_hash,
             "outcomes": outcomes,
             "trust_changes": [change.as_dict() for change in trust_changes],
             "water_cooler": lesson,
@@ -128,6 +130,15 @@ class GovernanceEngine:
             self.ledger.append(entry_type="ARBITRATION_OUTCOME", payload=payload, timestamp=timestamp)
         return payload
 
+    def _persist_registry_payload(self) -> None:
+        registry = self.registry
+        marker = (registry, registry.revision)
+        if self._persisted_marker == marker:
+            return
+        # hashed_snapshot() output is already normalized, so save_atomic writes it unchanged.
+        self.registry_store.save_atomic(registry.hashed_snapshot()[0])
+        self._persisted_marker = marker
+
     def reconstruct_registry_from_ledger(self) -> Dict[str, object]:
         if self.ledger is None:
             return self.registry.snapshot()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
-from .registry import normalize_registry_state
+from .constants import REGISTRY_HISTORY_LIMIT
+from .registry import apply_outcome_deltas, normalize_registry_state
 from .utils import canonical_hash, canonical_json
 
 
@@ -13,6 +15,10 @@ class GovernanceAuditLedger:
     def __init__(self, path: Path | str) -> None:
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        # (last seq, last entry_hash, file size) as of our last read or append.
+        self._tail: Tuple[int, str, int] | None = None
+        # ((size, mtime_ns), parsed entries) so replay and validation share one parse.
+        self._entries_cache: Tuple[Tuple[int, int], List[Dict[str, Any]]] | None = None
 
     @property
     def path(self) -> Path:
@@ -25,45 +31,132 @@ class GovernanceAuditLedger:
         payload: Mapping[str, Any],
         timestamp: str,
     ) -> Dict[str, Any]:
-        entries = self.read_entries()
-        previous_hash = entries[-1]["entry_hash"] if entries else "GENESIS"
-        seq = len(entries) + 1
-        record = {
-            "seq": seq,
-            "entry_type": str(entry_type).strip().upper(),
-            "timestamp": str(timestamp),
-            "payload": dict(payload),
-            "prev_hash": previous_hash,
-        }
-        entry_hash = canonical_hash(record)
-        persisted = dict(record)
-        persisted["entry_hash"] = entry_hash
+        return self.append_batch([(entry_type, payload, timestamp)])[0]
+
+    def append_batch(self, entries: Sequence[Tuple[str, Mapping[str, Any], str]]) -> List[Dict[str, Any]]:
+        """Chain ``(entry_type, payload, timestamp)`` entries and persist them with one fsync."""
+        if not entries:
+            return []
+        last_seq, previous_hash = self._chain_tail()
+        pre_append_key = self._stat_key()
+        persisted_entries: List[Dict[str, Any]] = []
+        lines: List[str] = []
+        for seq, (entry_type, payload, timestamp) in enumerate(entries, start=last_seq + 1):
+            record = {
+                "seq": seq,
+                "entry_type": str(entry_type).strip().upper(),
+                "timestamp": str(timestamp),
+                "payload": dict(payload),
+                "prev_hash": previous_hash,
+            }
+            record_json = canonical_json(record)
+            entry_hash = hashlib.sha256(record_json.encode("utf-8")).hexdigest()
+            persisted = dict(record)
+            persisted["entry_hash"] = entry_hash
+            persisted_entries.append(persisted)
+            # "entry_hash" sorts ahead of every record key, so the persisted line is the
+            # hashed record JSON with that field spliced in front; no second serialization.
+            lines.append(f'{{"entry_hash":"{entry_hash}",{record_json[1:]}')
+            lines.append("\n")
+            previous_hash = entry_hash
         with self._path.open("a", encoding="utf-8") as handle:
-            handle.write(canonical_json(persisted))
-            handle.write("\n")
+            handle.write("".join(lines))
             handle.flush()
             os.fsync(handle.fileno())
-        return persisted
+            stat_result = os.fstat(handle.fileno())
+        self._tail = (seq, previous_hash, stat_result.st_size)
+        self._extend_entries_cache(pre_append_key, (stat_result.st_size, stat_result.st_mtime_ns), lines[::2])
+        return persisted_entries
+
+    def _stat_key(self) -> Tuple[int, int] | None:
+        try:
+            stat_result = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat_result.st_size, stat_result.st_mtime_ns)
+
+    def _extend_entries_cache(
+        self,
+        pre_append_key: Tuple[int, int] | None,
+        post_append_key: Tuple[int, int],
+        appended_lines: List[str],
+    ) -> None:
+        cached = self._entries_cache
+        self._entries_cache = None
+        if cached is None or cached[0] != pre_append_key:
+            return
+        # Decode what was written rather than aliasing the caller's payload objects.
+        appended = [json.loads(line) for line in appended_lines]
+        entries = cached[1]
+        if entries and int(entries[-1].get("seq", 0)) > appended[0]["seq"]:
+            return
+        entries.extend(appended)
+        self._entries_cache = (post_append_key, entries)
+
+    def _chain_tail(self) -> Tuple[int, str]:
+        """Sequence number and hash to chain the next entry onto.
+
+        Cached from the last append; the file is only re-scanned when its size shows
+        that something else wrote to it.
+        """
+        try:
+            size = self._path.stat().st_size
+        except FileNotFoundError:
+            size = -1
+        cached = self._tail
+        if cached is not None and cached[2] == size:
+            return cached[0], cached[1]
+        entries = self._parsed_entries()
+        previous_hash = entries[-1]["entry_hash"] if entries else "GENESIS"
+        self._tail = (len(entries), previous_hash, size)
+        return len(entries), previous_hash
 
     def read_entries(self) -> List[Dict[str, Any]]:
-        if not self._path.exists():
+        return [dict(row) for row in self._parsed_entries()]
+
+    def _parsed_entries(self) -> List[Dict[str, Any]]:
+        """Parsed ledger rows in seq order, re-read only when the file's size or mtime moves.
+
+        The list and its rows are shared between callers; treat them as read-only.
+        """
+        key = self._stat_key()
+        if key is None:
+            self._entries_cache = None
             return []
+        cached = self._entries_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        entries = self._scan_entries()
+        self._entries_cache = (key, entries)
+        return entries
+
+    def _scan_entries(self) -> List[Dict[str, Any]]:
         entries: List[Dict[str, Any]] = []
-        for line in self._path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(row, Mapping):
-                entries.append(dict(row))
-        entries.sort(key=lambda row: int(row.get("seq", 0)))
+        in_order = True
+        last_seq = None
+        # Stream the file: a large ledger never sits in memory as one string plus its lines.
+        with self._path.open("r", encoding="utf-8", buffering=1 << 20) as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except Exception:
+                    continue
+                if isinstance(row, Mapping):
+                    seq = int(row.get("seq", 0))
+                    if last_seq is not None and seq < last_seq:
+                        in_order = False
+                    last_seq = seq
+                    entries.append(dict(row))
+        # Appends keep the file in seq order; only a hand-edited ledger needs sorting.
+        if not in_order:
+            entries.sort(key=lambda row: int(row.get("seq", 0)))
         return entries
 
     def reconstruct_registry(self, *, fallback_registry: Mapping[str, Any]) -> Dict[str, Any]:
         state = normalize_registry_state(fallback_registry)
-        for entry in self.read_entries():
+        for entry in self._parsed_entries():
             entry_type = str(entry.get("entry_type", "")).strip().upper()
             payload = entry.get("payload")
             if not isinstance(payload, Mapping):
@@ -84,7 +177,7 @@ class GovernanceAuditLedger:
         return normalize_registry_state(state)
 
     def validate_hash_chain(self) -> bool:
-        entries = self.read_entries()
+        entries = self._parsed_entries()
         previous_hash = "GENESIS"
         for expected_seq, entry in enumerate(entries, start=1):
             if int(entry.get("seq", -1)) != expected_seq:
@@ -104,7 +197,7 @@ class GovernanceAuditLedger:
         return True
 
     def validate_registry_hash(self, *, registry_state: Mapping[str, Any]) -> bool:
-        entries = self.read_entries()
+        entries = self._parsed_entries()
         registry_updates = [entry for entry in entries if str(entry.get("entry_type", "")).upper() == "REGISTRY_UPDATE"]
         if not registry_updates:
             return False
@@ -117,55 +210,48 @@ class GovernanceAuditLedger:
         return expected_hash == actual_hash
 
 
-def _apply_trust_change(state: Mapping[str, Any], payload: Mapping[str, Any]) -> Dict[str, Any]:
-    working = normalize_registry_state(state)
+def _apply_trust_change(state: Dict[str, Any], payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Replay one TRUST_CHANGE in place; ``state`` must already be normalized."""
     subject_id = str(payload.get("subject_id", "")).strip().lower()
-    if subject_id not in working["agents"]:
-        return working
+    if subject_id not in state["agents"]:
+        return state
 
     reputation_delta = float(payload.get("reputation_delta", 0.0))
     observer_deltas = payload.get("observer_trust_deltas")
     observer_trust_deltas = dict(observer_deltas) if isinstance(observer_deltas, Mapping) else {}
 
-    subject = working["agents"][subject_id]
-    subject["reputation_score"] = min(1.0, max(0.0, float(subject["reputation_score"]) + reputation_delta))
-
-    for observer_id, observer_state in working["agents"].items():
-        trust_weights = observer_state.get("trust_weights", {})
-        if not isinstance(trust_weights, dict):
-            continue
-        current = float(trust_weights.get(subject_id, 0.5))
-        delta = float(observer_trust_deltas.get(observer_id, 0.0))
-        trust_weights[subject_id] = min(1.0, max(0.0, current + delta))
+    apply_outcome_deltas(state["agents"], subject_id, reputation_delta, observer_trust_deltas)
 
-    working["version"] = int(working.get("version", 1)) + 1
+    state["version"] = int(state.get("version", 1)) + 1
     updated_at = str(payload.get("source_timestamp", "")).strip()
     if updated_at:
-        working["last_updated"] = updated_at
+        state["last_updated"] = updated_at
 
-    history = working.setdefault("history", {})
-    for agent_id, agent_state in working["agents"].items():
+    history = state.setdefault("history", {})
+    for agent_id, agent_state in state["agents"].items():
         series = history.setdefault(agent_id, [])
         series.append(float(agent_state.get("reputation_score", 0.5)))
-    return normalize_registry_state(working)
+        if len(series) > REGISTRY_HISTORY_LIMIT:
+            del series[: len(series) - REGISTRY_HISTORY_LIMIT]
+    return state
 
 
-def _apply_lesson_injection(state: Mapping[str, Any], payload: Mapping[str, Any]) -> Dict[str, Any]:
-    working = normalize_registry_state(state)
+def _apply_lesson_injection(state: Dict[str, Any], payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Replay one WATER_COOLER_LESSON in place; ``state`` must already be normalized."""
     lesson = payload.get("lesson")
     if not isinstance(lesson, Mapping):
-        return working
+        return state
     lesson_id = str(lesson.get("lesson_id", "")).strip()
     recipients = lesson.get("recipients")
     if not lesson_id or not isinstance(recipients, list):
-        return working
+        return state
 
     for recipient_raw in recipients:
         recipient = str(recipient_raw).strip().lower()
-        if recipient not in working["agents"]:
+        if recipient not in state["agents"]:
             continue
-        refs = working["agents"][recipient].setdefault("knowledge_lessons", [])
+        refs = state["agents"][recipient].setdefault("knowledge_lessons", [])
         if lesson_id not in refs:
             refs.append(lesson_id)
             refs.sort()
-    return normalize_registry_state(working)
+    return state
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Mapping, Sequence
+from typing import AbstractSet, Dict, List, Mapping, Sequence
 
 from .constants import (
     ESCALATION_EVENT_TYPES,
@@ -10,6 +10,12 @@ from .constants import (
 )
 from .utils import as_int, normalize_agent_id
 
+# Canonical (upper-case) event type -> outcome; SUCCESS wins if a type is in both sets.
+_EVENT_OUTCOMES: Dict[str, str] = {
+    **{event_type: "FAILURE" for event_type in FAILURE_EVENT_TYPES},
+    **{event_type: "SUCCESS" for event_type in SUCCESS_EVENT_TYPES},
+}
+
 
 class ProjectionOutcomeAdapter:
     def derive_outcomes(
@@ -17,11 +23,20 @@ class ProjectionOutcomeAdapter:
         *,
         previous_view: Mapping[str, object] | None,
         current_view: Mapping[str, object] | None,
-        known_agents: Sequence[str],
+        known_agents: Sequence[str] | AbstractSet[str],
+        normalized_ids: bool = False,
     ) -> List[Dict[str, object]]:
+        """Outcomes implied by one projection step.
+
+        ``known_agents`` is normalized first unless ``normalized_ids`` says it is already a
+        set of normalized ids (e.g. ``AgentRegistry.agent_id_set``), which is then used as is.
+        """
         previous = previous_view if isinstance(previous_view, Mapping) else {}
         current = current_view if isinstance(current_view, Mapping) else {}
-        known = {normalize_agent_id(agent_id) for agent_id in known_agents if normalize_agent_id(agent_id)}
+        if normalized_ids and isinstance(known_agents, AbstractSet):
+            known: AbstractSet[str] = known_agents
+        else:
+            known = {agent_id for agent_id in map(normalize_agent_id, known_agents) if agent_id}
         outcomes: List[Dict[str, object]] = []
 
         prev_event_id = as_int(previous.get("last_seen_event_id"), default=0)
@@ -29,55 +44,59 @@ class ProjectionOutcomeAdapter:
         if curr_event_id > prev_event_id:
             current_event = current.get("current_event")
             if isinstance(current_event, Mapping):
-                event_type = str(current_event.get("type", "")).strip().upper()
-                timestamp = str(current_event.get("timestamp", "")).strip()
-                subject_id = self._resolve_subject_id(current_event=current_event, known_agents=known)
-                if event_type and subject_id:
-                    outcome = self._event_outcome(event_type)
-                    if outcome:
-                        outcomes.append(
-                            {
-                                "agent_id": subject_id,
-                                "outcome": outcome,
-                                "escalated": event_type in ESCALATION_EVENT_TYPES,
-                                "source_event_type": event_type,
-                                "source_event_id": curr_event_id,
-                                "source_timestamp": timestamp,
-                            }
-                        )
+                event_type = current_event.get("type", "")
+                # Producers emit canonical types, so only normalize on a miss.
+                if not isinstance(event_type, str) or event_type not in _EVENT_OUTCOMES:
+                    event_type = str(event_type).strip().upper()
+                outcome = self._event_outcome(event_type)
+                subject_id = self._resolve_subject_id(current_event=current_event, known_agents=known) if outcome else ""
+                if subject_id:
+                    outcomes.append(
+                        {
+                            "agent_id": subject_id,
+                            "outcome": outcome,
+                            "escalated": event_type in ESCALATION_EVENT_TYPES,
+                            "source_event_type": event_type,
+                            "source_event_id": curr_event_id,
+                            "source_timestamp": str(current_event.get("timestamp", "")).strip(),
+                        }
+                    )
 
         prev_allowed, prev_denied = self._tool_counts(previous)
         curr_allowed, curr_denied = self._tool_counts(current)
         allowed_delta = max(0, curr_allowed - prev_allowed)
         denied_delta = max(0, curr_denied - prev_denied)
-        active_agents = self._active_agents(current, known)
-        for agent_id in active_agents:
+        if allowed_delta <= 0 and denied_delta <= 0:
+            return outcomes
+
+        # Only agent_id differs between the per-agent tool audit outcomes.
+        source_timestamp = str(current.get("timestamp", ""))
+        allowed_template = {
+            "agent_id": "",
+            "outcome": "SUCCESS",
+            "escalated": False,
+            "source_event_type": "TOOL_AUDIT_ALLOWED_DELTA",
+            "source_event_id": curr_event_id,
+            "source_timestamp": source_timestamp,
+        }
+        denied_template = {
+            "agent_id": "",
+            "outcome": "FAILURE",
+            "escalated": True,
+            "source_event_type": "TOOL_AUDIT_DENIED_DELTA",
+            "source_event_id": curr_event_id,
+            "source_timestamp": source_timestamp,
+        }
+        add_outcome = outcomes.append
+        for agent_id in self._active_agents(current, known):
             if allowed_delta > 0:
-                outcomes.append(
-                    {
-                        "agent_id": agent_id,
-                        "outcome": "SUCCESS",
-                        "escalated": False,
-                        "source_event_type": "TOOL_AUDIT_ALLOWED_DELTA",
-                        "source_event_id": curr_event_id,
-                        "source_timestamp": str(current.get("timestamp", "")),
-                    }
-                )
+                add_outcome({**allowed_template, "agent_id": agent_id})
             if denied_delta > 0:
-                outcomes.append(
-                    {
-                        "agent_id": agent_id,
-                        "outcome": "FAILURE",
-                        "escalated": True,
-                        "source_event_type": "TOOL_AUDIT_DENIED_DELTA",
-                        "source_event_id": curr_event_id,
-                        "source_timestamp": str(current.get("timestamp", "")),
-                    }
-                )
+                add_outcome({**denied_template, "agent_id": agent_id})
         return outcomes
 
     @staticmethod
-    def _resolve_subject_id(*, current_event: Mapping[str, object], known_agents: set[str]) -> str:
+    def _resolve_subject_id(*, current_event: Mapping[str, object], known_agents: AbstractSet[str]) -> str:
         payload = current_event.get("payload")
         if isinstance(payload, Mapping):
             for key in ("target_agent", "agent_id", "worker"):
@@ -92,11 +111,7 @@ class ProjectionOutcomeAdapter:
 
     @staticmethod
     def _event_outcome(event_type: str) -> str:
-        if event_type in SUCCESS_EVENT_TYPES:
-            return "SUCCESS"
-        if event_type in FAILURE_EVENT_TYPES:
-            return "FAILURE"
-        return ""
+        return _EVENT_OUTCOMES.get(event_type, "")
 
     @staticmethod
     def _tool_counts(view: Mapping[str, object]) -> tuple[int, int]:
@@ -109,14 +124,17 @@ class ProjectionOutcomeAdapter:
         )
 
     @staticmethod
-    def _active_agents(view: Mapping[str, object], known_agents: set[str]) -> List[str]:
+    def _active_agents(view: Mapping[str, object], known_agents: AbstractSet[str]) -> List[str]:
         workers = view.get("workers")
         if not isinstance(workers, Mapping):
             return sorted(known_agents)
         active: List[str] = []
         for worker_id_raw, state_raw in workers.items():
-            worker_id = normalize_agent_id(worker_id_raw)
-            if not worker_id or worker_id not in known_agents:
+            # normalize_agent_id inlined: this runs for every worker on every projection tick.
+            if not isinstance(worker_id_raw, str):
+                continue
+            worker_id = worker_id_raw.strip().lower()
+            if worker_id not in known_agents:
                 continue
             if not isinstance(state_raw, Mapping):
                 continue
@@ -3,10 +3,12 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, MutableMapping, Sequence
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, MutableMapping, Sequence, Tuple
 
 from .constants import (
     REGISTRY_EPOCH_TIMESTAMP,
+    REGISTRY_HISTORY_LIMIT,
     REGISTRY_INITIAL_VERSION,
     REGISTRY_SCHEMA_VERSION,
     REPUTATION_MAX,
@@ -14,10 +16,10 @@ from .constants import (
     TRUST_MAX,
     TRUST_MIN,
 )
-from .utils import as_float, as_int, atomic_write_text, clamp, normalize_agent_id
+from .utils import as_float, as_int, atomic_write_text, canonical_hash, clamp, normalize_agent_id
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class AgentDefinition:
     agent_id: str
     role: str
@@ -27,21 +29,20 @@ class AgentDefinition:
 def _normalize_trust_weights(
     value: Any,
     *,
-    all_agent_ids: Sequence[str],
+    sorted_agent_ids: Sequence[str],
 ) -> Dict[str, float]:
-    weights_raw = value if isinstance(value, Mapping) else {}
-    normalized: Dict[str, float] = {}
-    for peer_id in sorted(all_agent_ids):
-        weight_raw = weights_raw.get(peer_id, 0.5)
-        normalized[peer_id] = clamp(as_float(weight_raw, default=0.5), TRUST_MIN, TRUST_MAX)
-    return normalized
+    weight_for = value.get if isinstance(value, Mapping) else {}.get
+    return {
+        peer_id: clamp(as_float(weight_for(peer_id, 0.5), default=0.5), TRUST_MIN, TRUST_MAX)
+        for peer_id in sorted_agent_ids
+    }
 
 
 def _normalize_agent_state(
     agent_id: str,
     value: Any,
     *,
-    all_agent_ids: Sequence[str],
+    sorted_agent_ids: Sequence[str],
 ) -> Dict[str, Any]:
     source = value if isinstance(value, Mapping) else {}
     return {
@@ -49,7 +50,7 @@ def _normalize_agent_state(
         "role": str(source.get("role", "worker")).strip() or "worker",
         "authority_level": clamp(as_float(source.get("authority_level"), default=0.0), 0.0, 1.0),
         "reputation_score": clamp(as_float(source.get("reputation_score"), default=0.5), REPUTATION_MIN, REPUTATION_MAX),
-        "trust_weights": _normalize_trust_weights(source.get("trust_weights"), all_agent_ids=all_agent_ids),
+        "trust_weights": _normalize_trust_weights(source.get("trust_weights"), sorted_agent_ids=sorted_agent_ids),
         "knowledge_lessons": _normalize_knowledge_refs(source.get("knowledge_lessons")),
     }
 
@@ -66,13 +67,11 @@ def _normalize_knowledge_refs(value: Any) -> List[str]:
 
 
 def default_registry_state(agent_definitions: Sequence[AgentDefinition]) -> Dict[str, Any]:
-    agent_ids = sorted({normalize_agent_id(spec.agent_id) for spec in agent_definitions if normalize_agent_id(spec.agent_id)})
+    keyed_specs = [(agent_id, spec) for spec in agent_definitions if (agent_id := normalize_agent_id(spec.agent_id))]
+    agent_ids = sorted({agent_id for agent_id, _ in keyed_specs})
     agents: Dict[str, Dict[str, Any]] = {}
     history: Dict[str, List[float]] = {}
-    for spec in sorted(agent_definitions, key=lambda item: normalize_agent_id(item.agent_id)):
-        agent_id = normalize_agent_id(spec.agent_id)
-        if not agent_id:
-            continue
+    for agent_id, spec in sorted(keyed_specs, key=lambda item: item[0]):
         agents[agent_id] = {
             "agent_id": agent_id,
             "role": str(spec.role).strip() or "worker",
@@ -99,7 +98,7 @@ def normalize_registry_state(value: Any) -> Dict[str, Any]:
     agent_ids = sorted([agent_id for agent_id in (normalize_agent_id(key) for key in agents_input.keys()) if agent_id])
     agents: Dict[str, Dict[str, Any]] = {}
     for agent_id in agent_ids:
-        agents[agent_id] = _normalize_agent_state(agent_id, agents_input.get(agent_id), all_agent_ids=agent_ids)
+        agents[agent_id] = _normalize_agent_state(agent_id, agents_input.get(agent_id), sorted_agent_ids=agent_ids)
 
     history_raw = source.get("history")
     history_input = history_raw if isinstance(history_raw, Mapping) else {}
@@ -128,13 +127,41 @@ def normalize_registry_state(value: Any) -> Dict[str, Any]:
     }
 
 
+def apply_outcome_deltas(
+    agents: Mapping[str, MutableMapping[str, Any]],
+    subject_id: str,
+    reputation_delta: float,
+    observer_trust_deltas: Mapping[str, float],
+) -> None:
+    """Clamp-add one outcome's deltas into normalized agent states, in place.
+
+    Shared by live updates and ledger replay so both produce bit-identical state.
+    """
+    subject = agents[subject_id]
+    reputation = float(subject.get("reputation_score", 0.5)) + reputation_delta
+    subject["reputation_score"] = (
+        REPUTATION_MIN if reputation < REPUTATION_MIN else REPUTATION_MAX if reputation > REPUTATION_MAX else reputation
+    )
+    delta_for = observer_trust_deltas.get
+    for observer_id, observer in agents.items():
+        weights = observer.get("trust_weights")
+        if not isinstance(weights, MutableMapping):
+            weights = observer["trust_weights"] = {}
+        weight = float(weights.get(subject_id, 0.5)) + float(delta_for(observer_id, 0.0))
+        weights[subject_id] = TRUST_MIN if weight < TRUST_MIN else TRUST_MAX if weight > TRUST_MAX else weight
+
+
 class AgentRegistry:
     def __init__(self, state: Mapping[str, Any]) -> None:
         self._state = normalize_registry_state(state)
+        # The agent set is fixed once the registry is built; only per-agent values change.
+        self._agent_id_set = frozenset(self._state["agents"])
+        self._revision = 0
+        self._hashed_snapshot: Tuple[int, Dict[str, Any], str] | None = None
 
     @classmethod
     def from_definitions(cls, definitions: Sequence[AgentDefinition | Mapping[str, Any]]) -> "AgentRegistry":
-        normalized: List[AgentDefinition] = []
+        candidates: List[AgentDefinition] = []
         for value in definitions:
             if isinstance(value, AgentDefinition):
                 candidate = value
@@ -146,17 +173,9 @@ class AgentRegistry:
                 )
             else:
                 continue
-            agent_id = normalize_agent_id(candidate.agent_id)
-            if not agent_id:
-                continue
-            normalized.append(
-                AgentDefinition(
-                    agent_id=agent_id,
-                    role=str(candidate.role).strip() or "worker",
-                    authority_level=clamp(as_float(candidate.authority_level, default=0.0), 0.0, 1.0),
-                )
-            )
-        return cls(default_registry_state(normalized))
+            # default_registry_state owns id/role/authority normalization.
+            candidates.append(candidate)
+        return cls(default_registry_state(candidates))
 
     @property
     def version(self) -> int:
@@ -166,10 +185,20 @@ class AgentRegistry:
     def last_updated(self) -> str:
         return str(self._state["last_updated"])
 
+    @property
+    def revision(self) -> int:
+        """Counts in-place state changes, including lesson references that leave ``version`` alone."""
+        return self._revision
+
     @property
     def agent_ids(self) -> List[str]:
         return sorted(self._state["agents"].keys())
 
+    @property
+    def agent_id_set(self) -> frozenset[str]:
+        """Normalized agent ids, for membership checks without sorting or copying."""
+        return self._agent_id_set
+
     def has_agent(self, agent_id: str) -> bool:
         return normalize_agent_id(agent_id) in self._state["agents"]
 
@@ -196,6 +225,7 @@ class AgentRegistry:
         if lesson_id not in lessons:
             lessons.append(lesson_id)
             lessons.sort()
+            self._revision += 1
 
     def apply_outcome_update(
         self,
@@ -206,22 +236,11 @@ class AgentRegistry:
         updated_at: str,
     ) -> None:
         normalized_subject = normalize_agent_id(subject_id)
-        if normalized_subject not in self._state["agents"]:
+        agents = self._state["agents"]
+        if normalized_subject not in agents:
             return
 
-        subject = self._state["agents"][normalized_subject]
-        current_reputation = as_float(subject.get("reputation_score"), default=0.5)
-        subject["reputation_score"] = clamp(current_reputation + reputation_delta, REPUTATION_MIN, REPUTATION_MAX)
-
-        for observer_id in self.agent_ids:
-            observer = self._state["agents"][observer_id]
-            weights = observer.get("trust_weights", {})
-            if not isinstance(weights, MutableMapping):
-                weights = {}
-                observer["trust_weights"] = weights
-            current_weight = as_float(weights.get(normalized_subject), default=0.5)
-            delta = as_float(observer_trust_deltas.get(observer_id), default=0.0)
-            weights[normalized_subject] = clamp(current_weight + delta, TRUST_MIN, TRUST_MAX)
+        apply_outcome_deltas(agents, normalized_subject, float(reputation_delta), observer_trust_deltas)
 
         self._bump_version(updated_at=updated_at)
 
@@ -229,16 +248,38 @@ class AgentRegistry:
         self._bump_version(updated_at=updated_at)
 
     def _bump_version(self, *, updated_at: str) -> None:
+        self._revision += 1
         self._state["version"] = int(self._state["version"]) + 1
         self._state["last_updated"] = updated_at
         history = self._state.setdefault("history", {})
-        for agent_id in self.agent_ids:
-            series = history.setdefault(agent_id, [])
-            series.append(self.reputation_score(agent_id))
+        for agent_id, agent in self._state["agents"].items():
+            series = history.get(agent_id)
+            if series is None:
+                series = history[agent_id] = []
+            series.append(float(agent.get("reputation_score", 0.0)))
+            if len(series) > REGISTRY_HISTORY_LIMIT:
+                del series[: len(series) - REGISTRY_HISTORY_LIMIT]
+
+    def history_view(self) -> Mapping[str, Sequence[float]]:
+        """Live per-agent reputation history; callers must treat it as read-only."""
+        return MappingProxyType(self._state["history"])
 
     def snapshot(self) -> Dict[str, Any]:
         return normalize_registry_state(self._state)
 
+    def hashed_snapshot(self) -> Tuple[Dict[str, Any], str]:
+        """Snapshot plus its canonical hash, rebuilt only after the registry changes.
+
+        The cached snapshot is shared between calls; treat it as read-only.
+        """
+        cached = self._hashed_snapshot
+        if cached is not None and cached[0] == self._revision:
+            return cached[1], cached[2]
+        snapshot = self.snapshot()
+        snapshot_hash = canonical_hash(snapshot)
+        self._hashed_snapshot = (self._revision, snapshot, snapshot_hash)
+        return snapshot, snapshot_hash
+
 
 class AgentRegistryStore:
     def __init__(self, path: Path | str) -> None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 from .constants import (
     AUTHORITY_BANDS,
@@ -13,7 +13,7 @@ from .registry import AgentRegistry
 from .utils import clamp, normalize_agent_id
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class TrustChange:
     subject_id: str
     outcome: str
@@ -56,6 +56,15 @@ class RelationshipWeightEngine:
         outcomes: Iterable[Dict[str, object]],
     ) -> List[TrustChange]:
         changes: List[TrustChange] = []
+        # Authority levels do not change while outcomes are applied, so every agent's
+        # band scale is resolved once per call instead of once per (outcome, observer).
+        observer_ids = registry.agent_ids
+        authority_scales = {
+            agent_id: self._authority_scale(registry.authority_level(agent_id)) for agent_id in observer_ids
+        }
+        # Outcomes repeat the same (subject, outcome, escalated) triple; its deltas are
+        # computed once and the read-only observer map is shared between those changes.
+        deltas_by_key: Dict[Tuple[str, str, bool], Tuple[float, Dict[str, float]]] = {}
         for outcome in outcomes:
             subject_id = normalize_agent_id(outcome.get("agent_id"))
             if not subject_id or not registry.has_agent(subject_id):
@@ -67,15 +76,20 @@ class RelationshipWeightEngine:
             event_id = int(outcome.get("source_event_id", 0))
             source_timestamp = str(outcome.get("source_timestamp", ""))
 
-            reputation_delta = self._compute_reputation_delta(
-                outcome_type=outcome_type,
-                escalated=escalated,
-                subject_authority=registry.authority_level(subject_id),
-            )
-            observer_trust_deltas: Dict[str, float] = {}
-            for observer_id in registry.agent_ids:
-                observer_scale = self._authority_scale(registry.authority_level(observer_id))
-                observer_trust_deltas[observer_id] = reputation_delta * observer_scale
+            delta_key = (subject_id, outcome_type, escalated)
+            cached = deltas_by_key.get(delta_key)
+            if cached is None:
+                reputation_delta = self._compute_reputation_delta(
+                    outcome_type=outcome_type,
+                    escalated=escalated,
+                    authority_scale=authority_scales[subject_id],
+                )
+                observer_trust_deltas: Dict[str, float] = {
+                    observer_id: reputation_delta * authority_scales[observer_id] for observer_id in observer_ids
+                }
+                deltas_by_key[delta_key] = (reputation_delta, observer_trust_deltas)
+            else:
+                reputation_delta, observer_trust_deltas = cached
 
             registry.apply_outcome_update(
                 subject_id=subject_id,
@@ -97,8 +111,7 @@ class RelationshipWeightEngine:
             )
         return changes
 
-    def _compute_reputation_delta(self, *, outcome_type: str, escalated: bool, subject_authority: float) -> float:
-        authority_scale = self._authority_scale(subject_authority)
+    def _compute_reputation_delta(self, *, outcome_type: str, escalated: bool, authority_scale: float) -> float:
         if outcome_type == "SUCCESS":
             return self._success_step * authority_scale
         penalty = self._failure_step
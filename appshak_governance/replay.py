@@ -8,7 +8,7 @@ from .engine import GovernanceEngine
 from .utils import canonical_hash
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ReplayResult:
     final_registry_hash: str
     reconstructed_registry_hash: str
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +12,9 @@ def clamp(value: float, minimum: float, maximum: float) -> float:
 
 
 def as_int(value: Any, *, default: int = 0) -> int:
+    # Most inputs are already ints; skip the int() call and exception frame for them.
+    if type(value) is int:
+        return value
     try:
         return int(value)
     except Exception:
@@ -18,6 +22,8 @@ def as_int(value: Any, *, default: int = 0) -> int:
 
 
 def as_float(value: Any, *, default: float = 0.0) -> float:
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except Exception:
@@ -27,11 +33,23 @@ def as_float(value: Any, *, default: float = 0.0) -> float:
 def normalize_agent_id(value: Any) -> str:
     if not isinstance(value, str):
         return ""
+    return _normalize_agent_id_text(value)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_agent_id_text(value: str) -> str:
+    # Ids come from a small fixed pool of agents; bounded so arbitrary input cannot grow it.
     return value.strip().lower()
 
 
+# Ledger and registry hashes are taken over these exact bytes, so the encoding must stay
+# stdlib json (orjson formats floats and non-ASCII differently). One shared encoder avoids
+# json.dumps building a new JSONEncoder on every call.
+_CANONICAL_ENCODER = json.JSONEncoder(ensure_ascii=True, sort_keys=True, separators=(",", ":"))
+
+
 def canonical_json(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=True, sort_keys=True, separators=(",", ":"))
+    return _CANONICAL_ENCODER.encode(value)
 
 
 def canonical_hash(value: Any) -> str:
@@ -8,7 +8,7 @@ from .registry import AgentRegistry
 from .utils import as_float, as_int, canonical_hash, normalize_agent_id
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class WaterCoolerLesson:
     lesson_id: str
     schema_version: int
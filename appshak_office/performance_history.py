@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -47,10 +48,7 @@ class PerformanceHistoryManager:
     def export_history(self, output_path: str | Path) -> Path:
         output = Path(output_path)
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(
-            json.dumps(self._load(), indent=2, ensure_ascii=True),
-            encoding="utf-8",
-        )
+        self._atomic_write_text(output, json.dumps(self._load(), indent=2, ensure_ascii=True))
         return output
 
     def _load(self) -> Dict[str, Any]:
@@ -60,10 +58,17 @@ class PerformanceHistoryManager:
             return {"version": self.SCHEMA_VERSION, "records": []}
 
     def _save(self, payload: Dict[str, Any]) -> None:
-        self.history_path.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=True),
-            encoding="utf-8",
-        )
+        self._atomic_write_text(self.history_path, json.dumps(payload, indent=2, ensure_ascii=True))
+
+    @staticmethod
+    def _atomic_write_text(path: Path, text: str) -> None:
+        """Write via temp file + fsync + os.replace so a crash never leaves a torn file."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
 
     @staticmethod
     def _iso_now() -> str:
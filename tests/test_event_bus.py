@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import unittest
+
+from appshak.event_bus import Event, EventBus, EventType
+
+
+def _event(index: int) -> dict:
+    return {
+        "type": EventType.AGENT_STATUS.value,
+        "origin_id": "recon",
+        "payload": {"index": index},
+    }
+
+
+class TestEventBus(unittest.IsolatedAsyncioTestCase):
+    async def test_get_batch_drains_ready_events_in_order(self) -> None:
+        bus = EventBus()
+        for index in range(5):
+            await bus.publish(_event(index))
+
+        batch = await bus.get_batch(3)
+        self.assertEqual([event.payload["index"] for event in batch], [0, 1, 2])
+        self.assertEqual([event.payload["queue_index"] for event in batch], [1, 2, 3])
+
+        rest = await bus.get_batch(10)
+        self.assertEqual([event.payload["index"] for event in rest], [3, 4])
+        self.assertEqual(bus.qsize(), 0)
+
+    async def test_get_batch_returns_empty_list_on_timeout(self) -> None:
+        bus = EventBus()
+        self.assertEqual(await bus.get_batch(8, timeout=0.01), [])
+
+    async def test_get_nowait_returns_none_when_empty(self) -> None:
+        bus = EventBus()
+        self.assertIsNone(bus.get_nowait())
+        await bus.publish(_event(0))
+        self.assertEqual(bus.get_nowait().payload["index"], 0)
+        self.assertIsNone(bus.get_nowait())
+
+    async def test_published_event_is_frozen_and_shared(self) -> None:
+        bus = EventBus()
+        event = Event(type=EventType.AGENT_STATUS, timestamp="", origin_id="recon", payload={"index": 1})
+        published = await bus.publish(event)
+
+        self.assertTrue(published.timestamp)
+        self.assertIs(bus.get_nowait(), published)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            published.origin_id = "forge"
+
+    async def test_bounded_queue_applies_backpressure(self) -> None:
+        bus = EventBus(maxsize=1)
+        await bus.publish(_event(0))
+        blocked = asyncio.create_task(bus.publish(_event(1)))
+        await asyncio.sleep(0.01)
+        self.assertFalse(blocked.done())
+
+        first = await bus.get_next()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        second = await bus.get_next(timeout=0)
+        self.assertEqual(first.payload["index"], 0)
+        self.assertEqual(second.payload["index"], 1)
+
+    async def test_bounded_queue_keeps_queue_index_in_queue_order(self) -> None:
+        bus = EventBus(maxsize=1)
+        await bus.publish(_event(0))
+        blocked = asyncio.create_task(bus.publish(_event(1)))
+        await asyncio.sleep(0.01)
+
+        # Frees the slot before the blocked publisher resumes; a new publish must not jump it.
+        first = bus.get_nowait()
+
+        async def drain() -> list:
+            return [await bus.get_next(timeout=1.0) for _ in range(2)]
+
+        consumer = asyncio.create_task(drain())
+        await bus.publish(_event(2))
+        await blocked
+        events = [first, *await consumer]
+
+        self.assertEqual([event.payload["index"] for event in events], [0, 1, 2])
+        self.assertEqual([event.payload["queue_index"] for event in events], [1, 2, 3])
+
+    async def test_publish_hooks_are_classified_at_registration(self) -> None:
+        bus = EventBus()
+        seen = []
+
+        def sync_hook(event) -> None:
+            seen.append(("sync", event.payload["index"]))
+
+        async def async_hook(event) -> None:
+            seen.append(("async", event.payload["index"]))
+
+        bus.add_publish_hook(sync_hook)
+        bus.add_publish_hook(async_hook)
+        await bus.publish(_event(7))
+
+        self.assertEqual(seen, [("sync", 7), ("async", 7)])
+
+    async def test_publish_hooks_run_in_registration_order(self) -> None:
+        bus = EventBus()
+        seen = []
+
+        async def first(event) -> None:
+            seen.append("async-first")
+
+        bus.add_publish_hook(first)
+        bus.add_publish_hook(lambda event: seen.append("sync-second"))
+        await bus.publish(_event(1))
+
+        self.assertEqual(seen, ["async-first", "sync-second"])
+
+    async def test_publish_awaits_async_callable_objects_and_coroutine_returning_hooks(self) -> None:
+        bus = EventBus()
+        seen = []
+
+        class AsyncCallable:
+            async def __call__(self, event) -> None:
+                seen.append(("object", event.payload["index"]))
+
+        async def async_hook(event) -> None:
+            seen.append(("lambda", event.payload["index"]))
+
+        bus.add_publish_hook(AsyncCallable())
+        bus.add_publish_hook(lambda event: async_hook(event))
+        await bus.publish(_event(3))
+
+        self.assertEqual(sorted(seen), [("lambda", 3), ("object", 3)])
+
+    async def test_republished_event_gets_fresh_queue_index(self) -> None:
+        bus = EventBus()
+        event = Event(type=EventType.AGENT_STATUS, timestamp="", origin_id="recon", payload={"index": 1})
+
+        first = await bus.publish(event)
+        second = await bus.publish(event)
+
+        self.assertEqual(event.payload, {"index": 1})
+        self.assertEqual(event.timestamp, "")
+        self.assertEqual((first.payload["queue_index"], second.payload["queue_index"]), (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from appshak.file_watch import CREATE_MASK, DirectoryWatcher
+
+
+class TestDirectoryWatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_wait_returns_after_file_is_created(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_watch_") as temp_dir:
+            watcher = DirectoryWatcher(Path(temp_dir), poll_interval=0.05)
+            watcher.start()
+            try:
+                waiter = asyncio.create_task(watcher.wait_for_change(timeout=5.0))
+                await asyncio.sleep(0.01)
+                (Path(temp_dir) / "EMERGENCY_STOP").write_text("stop", encoding="utf-8")
+                await asyncio.wait_for(waiter, timeout=2.0)
+            finally:
+                watcher.close()
+
+    async def test_name_filter_ignores_other_files(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_watch_") as temp_dir:
+            directory = Path(temp_dir)
+            watcher = DirectoryWatcher(directory, poll_interval=0.05, mask=CREATE_MASK, names=("EMERGENCY_STOP",))
+            watcher.start()
+            if not watcher.native:
+                watcher.close()
+                self.skipTest("inotify unavailable")
+            try:
+                waiter = asyncio.create_task(watcher.wait_for_change(timeout=5.0))
+                await asyncio.sleep(0.01)
+                (directory / "kernel_state.json.tmp").write_text("{}", encoding="utf-8")
+                (directory / "kernel_state.json.tmp").replace(directory / "kernel_state.json")
+                await asyncio.sleep(0.1)
+                self.assertFalse(waiter.done())
+
+                (directory / "stop.tmp").write_text("stop", encoding="utf-8")
+                (directory / "stop.tmp").replace(directory / "EMERGENCY_STOP")
+                await asyncio.wait_for(waiter, timeout=2.0)
+            finally:
+                watcher.close()
+
+    async def test_polling_mode_returns_after_interval(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_watch_") as temp_dir:
+            watcher = DirectoryWatcher(Path(temp_dir), poll_interval=0.01)
+            await asyncio.wait_for(watcher.wait_for_change(), timeout=1.0)
+            self.assertFalse(watcher.native)
+
+    async def test_wait_returns_when_stop_event_is_set(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_watch_") as temp_dir:
+            watcher = DirectoryWatcher(Path(temp_dir), poll_interval=60.0)
+            watcher.start()
+            stop_event = asyncio.Event()
+            try:
+                waiter = asyncio.create_task(watcher.wait_for_change(stop_event=stop_event))
+                await asyncio.sleep(0.05)
+                stop_event.set()
+                await asyncio.wait_for(waiter, timeout=2.0)
+            finally:
+                watcher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from appshak.memory import GlobalMemory
+
+
+class TestGlobalMemoryLogs(unittest.IsolatedAsyncioTestCase):
+    async def test_tail_log_returns_last_lines_in_order(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            memory = GlobalMemory({"memory_root": str(Path(temp_dir) / "state")})
+            for index in range(50):
+                await memory.append_global_log("TEST", {"index": index})
+
+            tail = await memory.tail_log("global", 3)
+            self.assertEqual(len(tail), 3)
+            self.assertIn('"index":49', tail[-1].replace(" ", ""))
+            self.assertIn('"index":47', tail[0].replace(" ", ""))
+
+    async def test_stream_log_yields_new_lines_and_honors_stop_event(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            memory = GlobalMemory({"memory_root": str(Path(temp_dir) / "state")})
+            stop_event = asyncio.Event()
+            received = []
+
+            async def consume() -> None:
+                async for line in memory.stream_log("global", poll_interval=0.05, stop_event=stop_event):
+                    received.append(line)
+                    if len(received) == 2:
+                        stop_event.set()
+
+            consumer = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            await memory.append_global_log("TEST", {"index": 1})
+            await memory.append_global_log("TEST", {"index": 2})
+            await memory.flush_logs()
+            await asyncio.wait_for(consumer, timeout=2.0)
+            self.assertEqual(len(received), 2)
+
+    async def test_stream_log_stops_while_idle(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            memory = GlobalMemory({"memory_root": str(Path(temp_dir) / "state")})
+            stop_event = asyncio.Event()
+
+            async def consume() -> None:
+                async for _ in memory.stream_log("global", stop_event=stop_event):
+                    pass
+
+            consumer = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            stop_event.set()
+            await asyncio.wait_for(consumer, timeout=2.0)
+
+    async def test_iter_agent_events_rebuilds_capped_records(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            memory = GlobalMemory(
+                {"memory_root": str(Path(temp_dir) / "state"), "max_agent_events_in_memory": 2}
+            )
+            for index in range(3):
+                await memory.append_agent_event("recon", {"index": index})
+
+            events = list(memory.iter_agent_events("recon"))
+            self.assertEqual([event["payload"] for event in events], [{"index": 1}, {"index": 2}])
+            self.assertEqual({event["event_type"] for event in events}, {"AGENT_EVENT"})
+            self.assertEqual(list(memory.iter_agent_events("unknown")), [])
+
+            await memory.flush_logs()
+            lines = (Path(temp_dir) / "state" / "agents" / "recon.jsonl").read_text().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertIn('"payload":{"index":0}', lines[0].replace(" ", ""))
+
+    async def test_flush_logs_raises_failed_write_once(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            memory = GlobalMemory({"memory_root": str(Path(temp_dir) / "state")})
+            memory.global_log_path.mkdir()
+            await memory.append_global_log("TEST", {"index": 1})
+            with self.assertRaises(OSError):
+                await memory.flush_logs()
+            await memory.flush_logs()
+
+    async def test_reads_leave_write_failures_to_flush(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            memory = GlobalMemory({"memory_root": str(Path(temp_dir) / "state")})
+            memory.error_log_path.mkdir()
+            await memory.record_error("kernel", "boom")
+            self.assertEqual(await memory.tail_log("global"), [])
+            self.assertEqual(await memory.load_published_events_for_replay(), [])
+            with self.assertRaises(OSError):
+                await memory.flush_logs()
+
+    async def test_persist_all_writes_state_after_failed_log_write(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            memory = GlobalMemory({"memory_root": str(Path(temp_dir) / "state")})
+            kernel_state_path = memory.partition_paths["kernel_state"]
+            kernel_state_path.mkdir(parents=True)
+            with self.assertRaises(OSError):
+                await memory.save_kernel_state({"running": True})
+            kernel_state_path.rmdir()
+
+            memory.global_log_path.mkdir()
+            await memory.append_global_log("TEST", {"index": 1})
+            with self.assertRaises(OSError):
+                await memory.persist_all()
+            self.assertEqual(json.loads(kernel_state_path.read_text()), {"running": True})
+
+    async def test_load_state_rebuilds_history_from_logs_after_restart(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            config = {"memory_root": str(Path(temp_dir) / "state"), "max_agent_events_in_memory": 2}
+            memory = GlobalMemory(config)
+            await memory.record_error("kernel", "boom")
+            for index in range(3):
+                await memory.append_agent_event("recon", {"index": index})
+            await memory.save_kernel_state({"running": True})
+            await memory.persist_all()
+
+            restarted = GlobalMemory(config)
+            state = await restarted.load_state()
+            self.assertEqual([error["message"] for error in state["errors"]], ["boom"])
+            self.assertEqual(state["kernel_state"], {"running": True})
+            events = list(restarted.iter_agent_events("recon"))
+            self.assertEqual([event["payload"] for event in events], [{"index": 1}, {"index": 2}])
+
+    async def test_load_state_migrates_every_legacy_section(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_memory_") as temp_dir:
+            root = Path(temp_dir) / "state"
+            config = {"memory_root": str(root)}
+            memory = GlobalMemory(config)
+            legacy = {
+                "errors": [{"timestamp": "t0", "source": "kernel", "message": "legacy"}],
+                "agent_namespaces": {
+                    "forge": {"events": [{"timestamp": "t1", "event_type": "AGENT_EVENT", "payload": {"n": 1}}]}
+                },
+                "kernel_state": {"cycle": 7},
+                "external_pipeline": {"stage": "review"},
+            }
+            memory.store_path.write_text(json.dumps(legacy), encoding="utf-8")
+            await memory.load_state()
+            await memory.save_kernel_state({"cycle": 8})
+
+            restarted = GlobalMemory(config)
+            state = await restarted.load_state()
+            self.assertEqual(state["kernel_state"], {"cycle": 8})
+            self.assertEqual(state["external_pipeline"], {"stage": "review"})
+            self.assertEqual([error["message"] for error in state["errors"]], ["legacy"])
+            self.assertEqual([event["payload"] for event in restarted.iter_agent_events("forge")], [{"n": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,12 +6,15 @@ from pathlib import Path
 
 from appshak_governance import (
     BOARDROOM_DECISION_THRESHOLD,
+    REGISTRY_HISTORY_LIMIT,
     STABILITY_ROLLING_WINDOW,
     AgentRegistry,
     AgentRegistryStore,
     BoardroomArbitrator,
     DeterministicReplayHarness,
+    GovernanceAuditLedger,
     GovernanceEngine,
+    ProjectionOutcomeAdapter,
     RelationshipWeightEngine,
     TrustStabilityMetric,
     WaterCoolerPropagation,
@@ -181,6 +184,9 @@ class TestGovernancePhaseThreeCompletion(unittest.TestCase):
         result_1 = arbitrator.arbitrate(registry=registry, target_agent="command", ballots=ballots)
         result_2 = arbitrator.arbitrate(registry=registry, target_agent="command", ballots=ballots)
         self.assertEqual(result_1.as_dict(), result_2.as_dict())
+        summary = result_1.as_dict(include_votes=False)
+        self.assertNotIn("votes", summary)
+        self.assertEqual({**summary, "votes": result_1.as_dict()["votes"]}, result_1.as_dict())
         self.assertEqual(result_1.threshold, BOARDROOM_DECISION_THRESHOLD)
         self.assertEqual(result_1.approved, result_1.aggregate_score >= BOARDROOM_DECISION_THRESHOLD)
         for vote in result_1.votes:
@@ -245,6 +251,69 @@ class TestGovernancePhaseThreeCompletion(unittest.TestCase):
         self.assertGreaterEqual(result["global_variance"], 0.0)
         self.assertEqual(result["recorded_version"], registry.version)
 
+    def test_outcome_adapter_normalizes_unmarked_frozensets(self) -> None:
+        adapter = ProjectionOutcomeAdapter()
+        views = {
+            "previous_view": {"tool_audit_counts": {"allowed": 0}},
+            "current_view": {"tool_audit_counts": {"allowed": 1}},
+        }
+        outcomes = adapter.derive_outcomes(**views, known_agents=frozenset({" Recon "}))
+        self.assertEqual([outcome["agent_id"] for outcome in outcomes], ["recon"])
+
+        registry = AgentRegistry.from_definitions(_agent_definitions())
+        trusted = adapter.derive_outcomes(**views, known_agents=registry.agent_id_set, normalized_ids=True)
+        self.assertEqual([outcome["agent_id"] for outcome in trusted], sorted(registry.agent_id_set))
+
+    def test_registry_history_is_bounded(self) -> None:
+        registry = AgentRegistry.from_definitions(_agent_definitions())
+        for index in range(REGISTRY_HISTORY_LIMIT + 10):
+            registry.record_noop_update(updated_at=f"2026-03-01T01:00:00.{index:06d}+00:00")
+
+        history = registry.snapshot()["history"]
+        self.assertEqual({len(series) for series in history.values()}, {REGISTRY_HISTORY_LIMIT})
+        reloaded = AgentRegistry({**registry.snapshot(), "history": {"recon": [0.5] * (REGISTRY_HISTORY_LIMIT * 2)}})
+        self.assertEqual(len(reloaded.snapshot()["history"]["recon"]), REGISTRY_HISTORY_LIMIT * 2)
+        reloaded.record_noop_update(updated_at="2026-03-01T02:00:00+00:00")
+        self.assertEqual(len(reloaded.snapshot()["history"]["recon"]), REGISTRY_HISTORY_LIMIT)
+
+    def test_legacy_registry_with_long_history_keeps_ledger_hash(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="governance_legacy_history_") as tmp_dir:
+            ledger_path = Path(tmp_dir) / "ledger.jsonl"
+            legacy = AgentRegistry.from_definitions(_agent_definitions()).snapshot()
+            legacy["history"] = {agent_id: [0.5] * (REGISTRY_HISTORY_LIMIT + 44) for agent_id in legacy["agents"]}
+            legacy_hash = canonical_hash(legacy)
+            ledger = GovernanceAuditLedger(ledger_path)
+            ledger.append(
+                entry_type="REGISTRY_UPDATE",
+                payload={"registry": legacy, "registry_hash": legacy_hash},
+                timestamp=legacy["last_updated"],
+            )
+
+            registry = AgentRegistry(legacy)
+            self.assertEqual(registry.hashed_snapshot()[1], legacy_hash)
+            self.assertTrue(ledger.validate_registry_hash(registry_state=registry.snapshot()))
+            reconstructed = ledger.reconstruct_registry(fallback_registry=registry.snapshot())
+            self.assertEqual(canonical_hash(reconstructed), legacy_hash)
+
+    def test_unchanged_registry_reuses_serialized_payload(self) -> None:
+        engine = GovernanceEngine.from_agent_definitions(agent_definitions=_agent_definitions())
+        view = _projection_sequence()[-1]
+        first = engine.ingest_projection_delta(previous_view=view, current_view=view)
+        second = engine.ingest_projection_delta(previous_view=view, current_view=view)
+        self.assertEqual(second["registry_hash"], first["registry_hash"])
+        self.assertEqual(second["registry_hash"], canonical_hash(engine.registry.snapshot()))
+
+        second["registry"]["agents"]["recon"]["reputation_score"] = -1.0
+        second["registry"]["history"]["recon"].append(-1.0)
+        after_mutation = engine.ingest_projection_delta(previous_view=view, current_view=view)
+        self.assertEqual(after_mutation["registry"], first["registry"])
+        self.assertEqual(after_mutation["registry_hash"], canonical_hash(after_mutation["registry"]))
+
+        engine.registry.add_lesson_reference("recon", "lesson-x")
+        third = engine.ingest_projection_delta(previous_view=view, current_view=view)
+        self.assertIn("lesson-x", third["registry"]["agents"]["recon"]["knowledge_lessons"])
+        self.assertEqual(third["registry_hash"], canonical_hash(engine.registry.snapshot()))
+
     def test_governance_audit_ledger_reconstruction_and_hash_validation(self) -> None:
         with tempfile.TemporaryDirectory(prefix="governance_ledger_") as tmp_dir:
             registry_path = Path(tmp_dir) / "registry.json"
@@ -266,6 +335,23 @@ class TestGovernancePhaseThreeCompletion(unittest.TestCase):
             self.assertEqual(canonical_hash(reconstructed), canonical_hash(engine.registry.snapshot()))
             self.assertTrue(engine.ledger.validate_registry_hash(registry_state=engine.registry.snapshot()))
 
+    def test_ledger_appends_chain_across_writers(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="governance_ledger_writers_") as tmp_dir:
+            ledger_path = Path(tmp_dir) / "ledger.jsonl"
+            first = GovernanceAuditLedger(ledger_path)
+            second = GovernanceAuditLedger(ledger_path)
+            for index in range(3):
+                first.append(entry_type="NOTE", payload={"index": index, "writer": 1}, timestamp=str(index))
+                second.append(entry_type="NOTE", payload={"index": index, "writer": 2}, timestamp=str(index))
+
+            entries = first.read_entries()
+            self.assertEqual([entry["seq"] for entry in entries], list(range(1, 7)))
+            self.assertTrue(GovernanceAuditLedger(ledger_path).validate_hash_chain())
+
+            first.append(entry_type="NOTE", payload={"index": 3, "writer": 1}, timestamp="3")
+            self.assertEqual(first.read_entries(), GovernanceAuditLedger(ledger_path).read_entries())
+            self.assertEqual(second.read_entries()[-1]["seq"], 7)
+
     def test_deterministic_replay_harness_zero_tolerance(self) -> None:
         sequence = _projection_sequence()
         harness = DeterministicReplayHarness()
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from appshak import AppShakKernel
+from appshak.event_bus import EventType
+from appshak_substrate.bus_adapter import DurableEventBus
+from appshak_substrate.mailstore_sqlite import SQLiteMailStore
+from appshak_substrate.types import SubstrateEvent
+
+
+class _UnreadableStopFile(type(Path())):
+    def exists(self) -> bool:  # type: ignore[override]
+        raise PermissionError("stop file is not readable")
+
+
+def _config(temp_dir: str, **overrides) -> dict:
+    config = {
+        "memory_root": str(Path(temp_dir) / "state"),
+        "heartbeat_interval": 0.01,
+        "event_poll_timeout": 0.01,
+        "shutdown_grace_seconds": 1.0,
+    }
+    config.update(overrides)
+    return config
+
+
+def _status_event(index: int = 0) -> dict:
+    return {
+        "type": EventType.AGENT_STATUS.value,
+        "origin_id": "recon",
+        "payload": {"index": index, "prime_directive_justification": "Lifecycle test event."},
+    }
+
+
+async def _stop(kernel: AppShakKernel, runner: asyncio.Task) -> None:
+    await kernel.shutdown()
+    await asyncio.wait_for(runner, timeout=2.0)
+
+
+class TestKernelLifecycle(unittest.IsolatedAsyncioTestCase):
+    async def test_start_runs_until_shutdown_then_tears_down(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            kernel = AppShakKernel(_config(temp_dir))
+
+            runner = asyncio.create_task(kernel.start())
+            await asyncio.sleep(0.05)
+            tasks = [*kernel._agent_tasks, kernel._heartbeat_task, kernel._emergency_watch_task]
+            self.assertTrue(kernel.running)
+            self.assertEqual(len(tasks), len(kernel.agents) + 2)
+            self.assertFalse(any(task.done() for task in tasks))
+
+            await _stop(kernel, runner)
+
+            self.assertFalse(kernel.running)
+            self.assertTrue(kernel.shutdown_event.is_set())
+            self.assertTrue(all(task.done() and not task.cancelled() for task in tasks))
+            self.assertEqual(kernel._agent_tasks, [])
+            self.assertIsNone(kernel._heartbeat_task)
+            self.assertTrue(kernel.global_memory.partition_paths["kernel_state"].exists())
+
+    async def test_shutdown_cancels_loops_that_outlive_the_grace_period(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            kernel = AppShakKernel(_config(temp_dir, shutdown_grace_seconds=0.05))
+
+            async def ignores_stop() -> None:
+                await asyncio.sleep(60)
+
+            kernel.agents["forge"].run = ignores_stop
+            runner = asyncio.create_task(kernel.start())
+            await asyncio.sleep(0.05)
+            tasks = dict(zip(kernel.agents, kernel._agent_tasks))
+            stubborn = tasks.pop("forge")
+
+            await asyncio.wait_for(kernel.shutdown(), timeout=1.0)
+            await asyncio.wait_for(runner, timeout=1.0)
+
+            self.assertTrue(stubborn.cancelled())
+            self.assertTrue(all(task.done() and not task.cancelled() for task in tasks.values()))
+
+    async def test_publish_wakes_idle_heartbeat_and_batches_drain_everything(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            # A long interval and no idle scans: only publish wakeups can drive the heartbeat.
+            kernel = AppShakKernel(_config(temp_dir, heartbeat_interval=60.0, event_poll_timeout=None))
+
+            with mock.patch.object(AppShakKernel, "MAX_EVENT_BATCH", 2):
+                runner = asyncio.create_task(kernel.start())
+                await asyncio.sleep(0.05)
+                published = [await kernel.event_bus.publish(_status_event(index)) for index in range(5)]
+                await asyncio.sleep(0.2)
+                await _stop(kernel, runner)
+
+            records = [json.loads(line) for line in await kernel.global_memory.tail_log("global", lines=500)]
+            consumed = {
+                record["payload"]["queue_index"] for record in records if record["event_type"] == "EVENT_CONSUMED"
+            }
+            self.assertLessEqual({event.payload["queue_index"] for event in published}, consumed)
+
+    async def test_pipeline_locks_serialize_per_origin_and_are_dropped(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            kernel = AppShakKernel(_config(temp_dir))
+            order = []
+            release = asyncio.Event()
+
+            async def hold(origin_id: str, label: str) -> None:
+                async with kernel._pipeline_lock(origin_id):
+                    order.append(f"{label}-in")
+                    await release.wait()
+                    order.append(f"{label}-out")
+
+            first = asyncio.create_task(hold("recon", "first"))
+            same_origin = asyncio.create_task(hold("recon", "second"))
+            other_origin = asyncio.create_task(hold("forge", "other"))
+            await asyncio.sleep(0.01)
+
+            self.assertEqual(sorted(order), ["first-in", "other-in"])
+            self.assertEqual(kernel._pipeline_locks["recon"][1], 2)
+            release.set()
+            await asyncio.gather(first, same_origin, other_origin)
+
+            self.assertLess(order.index("first-out"), order.index("second-in"))
+            self.assertEqual(kernel._pipeline_locks, {})
+
+    async def test_emergency_stop_file_stops_the_kernel(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            stop_file = Path(temp_dir) / "EMERGENCY_STOP"
+            kernel = AppShakKernel(_config(temp_dir, emergency_stop_file=str(stop_file)))
+
+            runner = asyncio.create_task(kernel.start())
+            await asyncio.sleep(0.05)
+            self.assertTrue(kernel.running)
+            stop_file.touch()
+
+            await asyncio.wait_for(kernel.shutdown_event.wait(), timeout=1.0)
+            self.assertFalse(kernel.running)
+            await _stop(kernel, runner)
+            state = await kernel.global_memory.get_kernel_state()
+            self.assertTrue(state.get("emergency_stop"))
+
+    async def test_failing_emergency_watch_keeps_heartbeat_running(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            kernel = AppShakKernel(_config(temp_dir))
+            kernel._emergency_stop_file = _UnreadableStopFile(Path(temp_dir) / "state" / "EMERGENCY_STOP")
+
+            runner = asyncio.create_task(kernel.start())
+            await asyncio.sleep(0.1)
+
+            self.assertTrue(kernel.running)
+            self.assertFalse(runner.done())
+            self.assertFalse(kernel._heartbeat_task.done())
+            errors = await kernel.global_memory.tail_log("errors", lines=50)
+            self.assertTrue(any("emergency_watch" in line for line in errors))
+            await _stop(kernel, runner)
+
+    async def test_failed_log_writes_do_not_escape_start(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            kernel = AppShakKernel(_config(temp_dir))
+            kernel.global_memory.global_log_path.mkdir(parents=True)
+
+            runner = asyncio.create_task(kernel.start())
+            await asyncio.sleep(0.05)
+            await _stop(kernel, runner)
+
+            self.assertIsNone(runner.exception())
+            self.assertTrue(kernel.global_memory.partition_paths["kernel_state"].exists())
+            errors = await kernel.global_memory.tail_log("errors", lines=50)
+            self.assertTrue(any("memory_flush" in line for line in errors))
+
+    async def test_timing_changes_apply_to_running_heartbeat(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            kernel = AppShakKernel(_config(temp_dir, event_poll_timeout=None))
+            scans = []
+            kernel.event_bus.add_publish_hook(
+                lambda event: scans.append(event) if event.payload.get("action") == "search_for_problems" else None
+            )
+
+            runner = asyncio.create_task(kernel.start())
+            await asyncio.sleep(0.05)
+            self.assertEqual(scans, [])
+
+            kernel.idle_poll_timeout = 0.01
+            await kernel.event_bus.publish(_status_event())
+            await asyncio.sleep(0.1)
+            self.assertGreater(len(scans), 0)
+            await _stop(kernel, runner)
+
+    async def test_durable_bus_events_from_other_writers_are_polled(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            store = SQLiteMailStore(Path(temp_dir) / "mailstore.db", poll_interval=0.01)
+            kernel = AppShakKernel(
+                _config(temp_dir, heartbeat_interval=0.05, event_poll_timeout=None),
+                event_bus=DurableEventBus(store),
+            )
+
+            runner = asyncio.create_task(kernel.start())
+            await asyncio.sleep(0.05)
+            # Appended straight to the store, as another process would, so no publish hook fires.
+            store.append_event(
+                SubstrateEvent(
+                    type="TOOL_RESULT",
+                    origin_id="worker",
+                    payload={"prime_directive_justification": "Lifecycle test event."},
+                )
+            )
+            await asyncio.sleep(0.3)
+            await _stop(kernel, runner)
+
+            consumed = [
+                line for line in await kernel.global_memory.tail_log("global", lines=200) if "EVENT_CONSUMED" in line
+            ]
+            self.assertTrue(any("TOOL_RESULT" in line for line in consumed))
+
+    async def test_kernel_error_is_recorded_when_global_log_fails(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            kernel = AppShakKernel(_config(temp_dir))
+
+            async def failing_append(event_type, payload) -> None:
+                raise OSError("global log unavailable")
+
+            kernel.global_memory.append_global_log = failing_append
+            await kernel._log_kernel_error("test", RuntimeError("boom"))
+
+            errors = await kernel.global_memory.tail_log("errors")
+            self.assertEqual(len(errors), 1)
+            self.assertIn("boom", errors[0])
+
+    async def test_consumption_is_logged_even_when_routing_fails(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="appshak_kernel_lifecycle_") as temp_dir:
+            kernel = AppShakKernel(_config(temp_dir))
+
+            async def failing_arbitrate(event):
+                raise RuntimeError("arbitration failed")
+
+            kernel.agents["command"].arbitrate = failing_arbitrate
+            proposal = {**_status_event(), "type": EventType.PROPOSAL.value}
+            with self.assertRaises(RuntimeError):
+                await kernel._route_event(proposal)
+
+            lines = await kernel.global_memory.tail_log("global")
+            self.assertTrue(any("EVENT_CONSUMED" in line and "PROPOSAL" in line for line in lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import sys
+import types
 import unittest
+from unittest import mock
 
 from appshak.plugins.loader import PluginLoader
 
 
+def _plugin_module(module_name: str, plugin_name: str) -> types.ModuleType:
+    module = types.ModuleType(module_name)
+
+    class _Plugin:
+        name = plugin_name
+
+        async def dispatch(self, state_view) -> None:
+            return None
+
+    module.create_plugin = lambda config: _Plugin()
+    return module
+
+
 class TestPluginLoader(unittest.TestCase):
     def test_loader_returns_errors_without_crashing(self) -> None:
         loader = PluginLoader(["intent_engine", "missing_plugin_module_xyz"])
@@ -16,6 +32,45 @@ class TestPluginLoader(unittest.TestCase):
         self.assertEqual(errors[0].module_name, "missing_plugin_module_xyz")
         self.assertIn("Could not import plugin module", errors[0].error)
 
+    def test_repeated_load_reuses_resolved_module(self) -> None:
+        PluginLoader(["intent_engine"]).load()
+        with mock.patch("importlib.import_module", side_effect=AssertionError("re-imported")):
+            plugins, errors = PluginLoader(["intent_engine"]).load()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(getattr(plugins[0], "name", ""), "intent_engine")
+
+    def test_replaced_module_is_resolved_again(self) -> None:
+        module_name = "appshak_test_replaced_plugin"
+        self.addCleanup(sys.modules.pop, module_name, None)
+        sys.modules[module_name] = _plugin_module(module_name, "first")
+        first, _ = PluginLoader([module_name]).load()
+
+        sys.modules[module_name] = _plugin_module(module_name, "second")
+        second, _ = PluginLoader([module_name]).load()
+
+        self.assertEqual([plugin.name for plugin in first + second], ["first", "second"])
+
+    def test_every_instance_is_validated(self) -> None:
+        module_name = "appshak_test_shadowed_plugin"
+        self.addCleanup(sys.modules.pop, module_name, None)
+        module = _plugin_module(module_name, "shadowed")
+        sys.modules[module_name] = module
+        plugins, errors = PluginLoader([module_name]).load()
+        self.assertEqual((len(plugins), errors), (1, []))
+
+        make_valid = module.create_plugin
+
+        def make_shadowed(config):
+            plugin = make_valid(config)
+            plugin.dispatch = None
+            return plugin
+
+        module.create_plugin = make_shadowed
+        plugins, errors = PluginLoader([module_name]).load()
+        self.assertEqual(plugins, [])
+        self.assertIn("does not implement dispatch", errors[0].error)
+
 
 if __name__ == "__main__":
     unittest.main()
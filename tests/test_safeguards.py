@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import unittest
+
+from appshak.safeguards import SafeguardMonitor
+
+
+class TestSafeguardMonitor(unittest.IsolatedAsyncioTestCase):
+    async def test_action_key_follows_payload_mutation(self) -> None:
+        monitor = SafeguardMonitor({"safeguard_retry_max": 3})
+        event = {"payload": {"action": "fetch", "endpoint": "https://a.example"}}
+
+        first = await monitor.record_attempt(event, origin_id="recon", success=False)
+        event["payload"]["endpoint"] = "https://b.example"
+        second = await monitor.record_attempt(event, origin_id="recon", success=False)
+
+        self.assertEqual(first["action_key"], "recon:fetch:https://a.example")
+        self.assertEqual(second["action_key"], "recon:fetch:https://b.example")
+        self.assertEqual(second["retries"], 1)
+
+    async def test_stages_share_explicitly_passed_facts(self) -> None:
+        monitor = SafeguardMonitor({"endpoint_whitelist": ["https://a.example"]})
+        event = {"payload": {"action": "fetch", "endpoint": "https://a.example", "method": "SIMULATE"}}
+        facts = monitor.derive_facts(event, "recon")
+
+        check = await monitor.check_request(event, origin_id="recon", facts=facts)
+        event["payload"]["endpoint"] = "https://elsewhere.example"
+        execution = await monitor.execute_in_sandbox(event, origin_id="recon", facts=facts)
+        attempt = await monitor.record_attempt(event, origin_id="recon", success=True, facts=facts)
+
+        self.assertTrue(check["allowed"])
+        self.assertEqual(execution["endpoint"], "https://a.example")
+        self.assertEqual(attempt["action_key"], check["action_key"])
+
+
+if __name__ == "__main__":
+    unittest.main()